@@ -39,10 +39,10 @@ def check_docs():
         results.append((d, path.exists()))
     return results
 
-def check_config():
+def check_config(config=None):
     """Verify config keys."""
     try:
-        config = ConfigLoader.load()
+        config = config or ConfigLoader.load()
         required_fields = ["suite_enabled", "data_root", "model_host_enabled", "models"]
         results = []
         for f in required_fields:
@@ -90,14 +90,14 @@ def run_doctor():
     table = Table(title="Configuration")
     table.add_column("Key")
     table.add_column("Status")
-    config = ConfigLoader.load() # Load config once for both config checks
-    for key, ok in check_config():
+    config = ConfigLoader.load() # Load config once for every section below
+    for key, ok in check_config(config):
         status = "[green]OK[/green]" if ok else "[red]MISSING[/red]"
         table.add_row(key, status)
-    pipeline_dirs = ["raw", "curated"]
-    for d in pipeline_dirs:
-        p = config.data_root / "datasets" / d
-        table.add_row(f"Dataset Dir ({d})", "[green]OK[/green]" if p.exists() else "[yellow]NOT CREATED YET[/yellow]")
+    # Reused by the pipeline section instead of stat'ing the same dirs again
+    dataset_dirs = [(d, (config.data_root / "datasets" / d).exists()) for d in ["raw", "curated"]]
+    for d, exists in dataset_dirs:
+        table.add_row(f"Dataset Dir ({d})", "[green]OK[/green]" if exists else "[yellow]NOT CREATED YET[/yellow]")
     console.print(table)
     
     # Phase 4: Registry Config Verification
@@ -139,16 +139,13 @@ def run_doctor():
     table = Table(title="Pipeline Config Verification")
     table.add_column("Check")
     table.add_column("Status")
-    config = ConfigLoader.load()
     if config.data_root.exists():
         table.add_row("Data Root Mounted", "[green]OK[/green]")
     else:
         table.add_row("Data Root Mounted", "[red]MISSING[/red]")
         
-    pipeline_dirs = ["raw", "curated"]
-    for d in pipeline_dirs:
-        p = config.data_root / "datasets" / d
-        table.add_row(f"Dataset Dir ({d})", "[green]OK[/green]" if p.exists() else "[yellow]NOT CREATED YET[/yellow]")
+    for d, exists in dataset_dirs:
+        table.add_row(f"Dataset Dir ({d})", "[green]OK[/green]" if exists else "[yellow]NOT CREATED YET[/yellow]")
     console.print(table)
 
 if __name__ == "__main__":
@@ -5,9 +5,7 @@ Provides unified API keys that work across different model providers,
 giving users a single key to access all Heidi-managed models.
 """
 
-from .key_manager import APIKeyManager, get_api_key_manager
-from .auth import HeidiAuthenticator, get_authenticator
-from .router import APIRouter, get_api_router
+from importlib import import_module
 
 __all__ = [
     "APIKeyManager",
@@ -17,3 +15,20 @@ __all__ = [
     "APIRouter",
     "get_api_router"
 ]
+
+# Resolved on first access so `heidi api ...` doesn't pull in FastAPI and the
+# provider integrations just to manage keys
+_EXPORTS = {
+    "APIKeyManager": ".key_manager",
+    "get_api_key_manager": ".key_manager",
+    "HeidiAuthenticator": ".auth",
+    "get_authenticator": ".auth",
+    "APIRouter": ".router",
+    "get_api_router": ".router",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,11 +5,17 @@ Handles authentication and authorization for Heidi API keys.
 """
 
 import time
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
 from .key_manager import get_api_key_manager, APIKey
-from ..integrations.analytics import UsageAnalytics
+from ..integrations.analytics import get_analytics
+
+# Upper bound on tracked keys; least recently used entries are evicted first
+RATE_LIMIT_CACHE_SIZE = 1024
+# Entries idle for longer than this are dropped on cleanup
+RATE_LIMIT_IDLE_TTL = 300
 
 
 @dataclass
@@ -26,8 +32,9 @@ class HeidiAuthenticator:
     
     def __init__(self):
         self.key_manager = get_api_key_manager()
-        self.analytics = UsageAnalytics()
-        self._rate_limit_cache: Dict[str, Dict] = {}
+        self.analytics = get_analytics()
+        self._rate_limit_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._last_cleanup = time.time()
     
     def authenticate(self, api_key: str, request_info: Dict = None) -> AuthResult:
         """Authenticate an API key and check rate limits."""
@@ -62,14 +69,16 @@ class HeidiAuthenticator:
         current_time = time.time()
         key_id = api_key.key_id
         
-        # Get or create rate limit entry
-        if key_id not in self._rate_limit_cache:
-            self._rate_limit_cache[key_id] = {
-                "requests": [],
-                "last_cleanup": current_time
-            }
-        
-        rate_info = self._rate_limit_cache[key_id]
+        # Get or create rate limit entry, keeping the cache in LRU order
+        rate_info = self._rate_limit_cache.get(key_id)
+        if rate_info is None:
+            rate_info = {"requests": [], "last_seen": current_time}
+            self._rate_limit_cache[key_id] = rate_info
+            if len(self._rate_limit_cache) > RATE_LIMIT_CACHE_SIZE:
+                self._rate_limit_cache.popitem(last=False)
+        else:
+            self._rate_limit_cache.move_to_end(key_id)
+        rate_info["last_seen"] = current_time
         
         # Clean old requests (older than 1 minute)
         cutoff_time = current_time - 60
@@ -85,25 +94,22 @@ class HeidiAuthenticator:
         # Add current request
         rate_info["requests"].append(current_time)
         
-        # Cleanup old entries periodically
-        if current_time - rate_info["last_cleanup"] > 300:  # 5 minutes
+        # Cleanup idle entries periodically
+        if current_time - self._last_cleanup > RATE_LIMIT_IDLE_TTL:
             self._cleanup_rate_limits()
-            rate_info["last_cleanup"] = current_time
+            self._last_cleanup = current_time
         
         return False
     
     def _cleanup_rate_limits(self):
-        """Clean up old rate limit entries."""
-        current_time = time.time()
-        cutoff_time = current_time - 300  # 5 minutes
-        
-        # Remove old entries
-        old_keys = [
-            key_id for key_id, info in self._rate_limit_cache.items()
-            if info["last_cleanup"] < cutoff_time
-        ]
-        
-        for key_id in old_keys:
+        """Drop rate limit entries that have been idle past the TTL."""
+        cutoff_time = time.time() - RATE_LIMIT_IDLE_TTL
+        
+        # Entries are in LRU order, so idle ones are at the front
+        while self._rate_limit_cache:
+            key_id, info = next(iter(self._rate_limit_cache.items()))
+            if info["last_seen"] >= cutoff_time:
+                break
             del self._rate_limit_cache[key_id]
     
     def _record_auth_success(self, api_key: APIKey, request_info: Dict = None):
@@ -11,13 +11,16 @@ import secrets
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
-import json
 import sqlite3
 from dataclasses import dataclass, asdict
 
 from ..shared.config import ConfigLoader
+from ..shared.serialization import dumps, loads
 from ..runtime.db import db
 
+# Every generated key carries this prefix; anything else cannot match a stored hash
+API_KEY_PREFIX = "heidik_"
+
 
 @dataclass
 class APIKey:
@@ -100,7 +103,7 @@ class APIKeyManager:
         
         # Generate unique key
         key_id = str(uuid.uuid4())
-        raw_key = f"heidik_{secrets.token_urlsafe(32)}"
+        raw_key = f"{API_KEY_PREFIX}{secrets.token_urlsafe(32)}"
         api_key = self._hash_api_key(raw_key)
         
         # Set expiration
@@ -151,13 +154,17 @@ class APIKeyManager:
                 api_key.rate_limit,
                 api_key.usage_count,
                 api_key.last_used.isoformat() if api_key.last_used else None,
-                json.dumps(api_key.permissions),
-                json.dumps(api_key.metadata)
+                dumps(api_key.permissions),
+                dumps(api_key.metadata)
             ))
             conn.commit()
     
     def validate_api_key(self, api_key: str) -> Optional[APIKey]:
         """Validate an API key and return the key object if valid."""
+        # Reject malformed keys before hashing and opening a database connection
+        if not api_key.startswith(API_KEY_PREFIX):
+            return None
+
         hashed_key = self._hash_api_key(api_key)
         
         with db.get_connection() as conn:
@@ -182,8 +189,8 @@ class APIKeyManager:
                 rate_limit=row['rate_limit'],
                 usage_count=row['usage_count'],
                 last_used=datetime.fromisoformat(row['last_used']) if row['last_used'] else None,
-                permissions=json.loads(row['permissions']),
-                metadata=json.loads(row['metadata'])
+                permissions=loads(row['permissions']),
+                metadata=loads(row['metadata'])
             )
             
             # Check if expired
@@ -228,8 +235,8 @@ class APIKeyManager:
                     rate_limit=row['rate_limit'],
                     usage_count=row['usage_count'],
                     last_used=datetime.fromisoformat(row['last_used']) if row['last_used'] else None,
-                    permissions=json.loads(row['permissions']),
-                    metadata=json.loads(row['metadata'])
+                    permissions=loads(row['permissions']),
+                    metadata=loads(row['metadata'])
                 )
                 keys.append(api_key_obj)
             
@@ -13,12 +13,29 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from .key_manager import get_api_key_manager
 from .auth import get_authenticator, AuthResult
-from ..model_host.manager import ModelManager
+from ..model_host.manager import MODELS_CACHE_TTL, ModelManager
 from ..integrations.huggingface import get_huggingface_integration
-from ..integrations.analytics import UsageAnalytics
+from ..integrations.analytics import get_analytics
 from ..token_tracking.models import get_token_database, TokenUsage
 
 
+# Popular HuggingFace models advertised by /v1/models
+FEATURED_HF_MODELS = (
+    {
+        "id": "hf://TinyLlama/TinyLlama-1.1B-Chat-v1.0",
+        "name": "TinyLlama Chat",
+        "description": "Small conversational model",
+        "provider": "huggingface"
+    },
+    {
+        "id": "hf://microsoft/DialoGPT-small",
+        "name": "DialoGPT Small",
+        "description": "Conversational AI model",
+        "provider": "huggingface"
+    },
+)
+
+
 class APIRouter:
     """Routes authenticated requests to appropriate model providers."""
     
@@ -27,9 +44,11 @@ class APIRouter:
         self.authenticator = get_authenticator()
         self.model_manager = ModelManager()
         self.huggingface = get_huggingface_integration()
-        self.analytics = UsageAnalytics()
+        self.analytics = get_analytics()
         self.token_db = get_token_database()
         self.security = HTTPBearer()
+        # (built_at, provider -> models) for list_available_models
+        self._available_models: Optional[tuple] = None
     
     async def route_request(
         self,
@@ -72,8 +91,9 @@ class APIRouter:
             end_time = time.time()
             response_time_ms = (end_time - start_time) * 1000
             
-            self._record_usage(
-                model, messages, response, response_time_ms, True
+            # Analytics and token tracking write to SQLite; keep that off the loop
+            await asyncio.to_thread(
+                self._record_usage, model, messages, response, response_time_ms, True
             )
             
             return response
@@ -83,8 +103,8 @@ class APIRouter:
             end_time = time.time()
             response_time_ms = (end_time - start_time) * 1000
             
-            self._record_usage(
-                model, messages, {}, response_time_ms, False, str(e)
+            await asyncio.to_thread(
+                self._record_usage, model, messages, {}, response_time_ms, False, str(e)
             )
             
             raise HTTPException(
@@ -260,7 +280,16 @@ class APIRouter:
     
     def list_available_models(self) -> Dict[str, List[Dict]]:
         """List all available models from all providers."""
-        
+        now = time.monotonic()
+        cached = self._available_models
+        if cached is not None and now - cached[0] < MODELS_CACHE_TTL:
+            return {provider: list(entries) for provider, entries in cached[1].items()}
+
+        models = self._build_available_models()
+        self._available_models = (now, models)
+        return {provider: list(entries) for provider, entries in models.items()}
+
+    def _build_available_models(self) -> Dict[str, List[Dict]]:
         models = {
             "local": [],
             "huggingface": [],
@@ -283,24 +312,7 @@ class APIRouter:
             pass
         
         # HuggingFace models (popular ones)
-        try:
-            hf_models = [
-                {
-                    "id": "hf://TinyLlama/TinyLlama-1.1B-Chat-v1.0",
-                    "name": "TinyLlama Chat",
-                    "description": "Small conversational model",
-                    "provider": "huggingface"
-                },
-                {
-                    "id": "hf://microsoft/DialoGPT-small",
-                    "name": "DialoGPT Small",
-                    "description": "Conversational AI model",
-                    "provider": "huggingface"
-                }
-            ]
-            models["huggingface"] = hf_models
-        except Exception:
-            pass
+        models["huggingface"] = list(FEATURED_HF_MODELS)
         
         return models
 
@@ -5,9 +5,10 @@ FastAPI server that provides unified API access to all Heidi models.
 Users can authenticate with Heidi API keys and access models from any provider.
 """
 
+import json
 import time
 from typing import Dict, List, Optional, Any
-from fastapi import FastAPI, HTTPException, Depends, Security
+from fastapi import FastAPI, HTTPException, Depends, Response, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
@@ -15,6 +16,8 @@ from pydantic import BaseModel, Field
 from .key_manager import get_api_key_manager
 from .auth import get_authenticator, AuthResult
 from .router import get_api_router
+from ..shared.config import CORS_MAX_AGE, get_cors_origins
+from ..shared.middleware import add_gzip_middleware
 
 
 # Pydantic models for API requests
@@ -52,12 +55,16 @@ app = FastAPI(
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=get_cors_origins(),
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=CORS_MAX_AGE,
 )
 
+# Compress large JSON bodies (model lists, completions); SSE streams are left alone
+add_gzip_middleware(app)
+
 # Security
 security = HTTPBearer()
 
@@ -95,20 +102,24 @@ async def authenticate_api_key(credentials: HTTPAuthorizationCredentials = Secur
     return auth_result
 
 
+# The root document never changes, so serialize it once
+_ROOT_BODY = json.dumps({
+    "service": "Heidi API",
+    "version": "1.0.0",
+    "description": "Unified API access to all Heidi-managed models",
+    "endpoints": {
+        "chat": "/v1/chat/completions",
+        "models": "/v1/models",
+        "health": "/health",
+        "docs": "/docs"
+    }
+}).encode("utf-8")
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "service": "Heidi API",
-        "version": "1.0.0",
-        "description": "Unified API access to all Heidi-managed models",
-        "endpoints": {
-            "chat": "/v1/chat/completions",
-            "models": "/v1/models",
-            "health": "/health",
-            "docs": "/docs"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
@@ -145,7 +156,7 @@ async def list_models(auth_result: AuthResult = Depends(authenticate_api_key)):
         )
 
 
-@app.post("/v1/chat/completions")
+@app.post("/v1/chat/completions", responses={200: {"model": ChatCompletionResponse}})
 async def chat_completions(
     request: ChatCompletionRequest,
     auth_result: AuthResult = Depends(authenticate_api_key)
@@ -166,7 +177,8 @@ async def chat_completions(
             max_tokens=request.max_tokens
         )
         
-        return ChatCompletionResponse(**response)
+        # Provider responses are already OpenAI-shaped; skip re-validating them
+        return response
         
     except HTTPException:
         raise
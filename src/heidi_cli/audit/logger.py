@@ -15,6 +15,7 @@ import sqlite3
 import logging
 import gzip
 import threading
+import time
 
 logger = logging.getLogger("heidi.audit")
 
@@ -25,6 +26,8 @@ class AuditLevel(Enum):
     ERROR = "error"
     CRITICAL = "critical"
 
+_ERROR_LEVELS = frozenset({AuditLevel.ERROR, AuditLevel.CRITICAL})
+
 class ComplianceCategory(Enum):
     """Compliance categories."""
     SECURITY = "security"
@@ -476,7 +479,7 @@ class AuditLogger:
                 processing_times.append(event.processing_time_ms)
             
             # Count errors
-            if event.level in [AuditLevel.ERROR, AuditLevel.CRITICAL]:
+            if event.level in _ERROR_LEVELS:
                 error_count += 1
         
         # Calculate averages
@@ -620,7 +623,6 @@ class AuditLogger:
                 try:
                     self._cleanup_old_records()
                     # Sleep for 24 hours
-                    import time
                     time.sleep(86400)
                 except Exception as e:
                     logger.error(f"Cleanup thread error: {e}")
@@ -4,6 +4,7 @@ Enhanced caching system with Redis support and intelligent cache management.
 
 from __future__ import annotations
 
+import fnmatch
 import json
 import hashlib
 import pickle
@@ -31,6 +32,9 @@ class CacheLevel(Enum):
     REDIS = "redis"
     DISK = "disk"
 
+_MEMORY_WRITE_LEVELS = frozenset({CacheLevel.MEMORY, CacheLevel.REDIS})
+_REDIS_WRITE_LEVELS = frozenset({CacheLevel.REDIS, CacheLevel.DISK})
+
 @dataclass
 class CacheEntry:
     """Cache entry with metadata."""
@@ -229,7 +233,6 @@ class MemoryCache(CacheBackend):
     def keys(self, pattern: str = "*") -> List[str]:
         """Get keys matching pattern."""
         with self._lock:
-            import fnmatch
             return [key for key in self._cache.keys() 
                    if fnmatch.fnmatch(key, pattern)]
     
@@ -467,10 +470,10 @@ class CacheManager:
         """Set value in specified cache level(s)."""
         success = True
         
-        if level in [CacheLevel.MEMORY, CacheLevel.REDIS]:
+        if level in _MEMORY_WRITE_LEVELS:
             success &= self.memory_cache.set(key, value, ttl_seconds)
         
-        if self.redis_cache and level in [CacheLevel.REDIS, CacheLevel.DISK]:
+        if self.redis_cache and level in _REDIS_WRITE_LEVELS:
             success &= self.redis_cache.set(key, value, ttl_seconds)
         
         return success
@@ -6,7 +6,7 @@ from typing import List, Optional
 from rich.console import Console
 
 from .shared.config import ConfigLoader
-from .launcher import start_daemon, stop_process, load_pids
+from .launcher import start_daemon, stop_process, load_pids, wait_for_http
 from .token_tracking.cli import register_tokens_app
 from .api.cli import register_api_app
 
@@ -56,16 +56,19 @@ def _configure_model(model_path: str, model_id: Optional[str] = None):
 @app.command()
 def doctor():
     """Run suite verification checks."""
+    import importlib.util
     from pathlib import Path
 
     doctor_script = Path(__file__).parent.parent.parent / "scripts" / "doctor.py"
     if doctor_script.exists():
-        namespace = {"__file__": str(doctor_script)}
-        exec(doctor_script.read_text(), namespace)
-        if "run_doctor" in namespace:
-            namespace["run_doctor"]()
-        elif "check_all" in namespace:
-            namespace["check_all"]()
+        # Load as a module so the compiled bytecode in __pycache__ is reused between runs
+        spec = importlib.util.spec_from_file_location("heidi_doctor_script", doctor_script)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if hasattr(module, "run_doctor"):
+            module.run_doctor()
+        elif hasattr(module, "check_all"):
+            module.check_all()
     else:
         console.print(f"[red]Doctor script not found at {doctor_script}[/red]")
 
@@ -241,7 +244,11 @@ def setup_opencode(
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
             )
-            console.print(f"✓ Model host starting on port {port}")
+            if wait_for_http(f"http://localhost:{port}/health", timeout=15.0):
+                console.print(f"✓ Model host ready on port {port}")
+            else:
+                console.print(f"[yellow]⚠ Model host not answering on port {port} yet[/yellow]")
+                console.print("Check progress with: heidi model status")
         except Exception as e:
             console.print(f"[yellow]⚠ Could not auto-start: {e}[/yellow]")
             console.print("Start manually with: heidi model serve")
@@ -323,14 +330,19 @@ def setup(
         try:
             # Upgrade pip first
             subprocess.run(
-                [str(pip_path), "install", "--upgrade", "pip"], check=True, capture_output=True
+                [str(pip_path), "install", "--upgrade", "pip"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
 
-            # Install the package in editable mode with dev dependencies
+            # Install the package in editable mode with dev dependencies; pip's
+            # progress output is discarded rather than buffered, only errors are kept
             result = subprocess.run(
                 [str(pip_path), "install", "-e", ".[dev]"],
                 cwd=str(project_root),
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
             )
             if result.returncode != 0:
@@ -538,6 +550,13 @@ def model_serve():
         "--port",
         str(config.port),
     ]
+    if config.workers > 1:
+        cmd += ["--workers", str(config.workers)]
+        # /v1/model/reload lands on whichever worker accepts it; the others keep the old model
+        console.print(
+            f"[yellow]Running {config.workers} workers: /v1/model/reload only reaches one of them. "
+            "Restart the model host after promoting a model.[/yellow]"
+        )
 
     pid = start_daemon("model_host", cmd, "model_host.log")
     console.print(f"[green]✓ Model host started (PID: {pid})[/green]")
@@ -637,19 +656,24 @@ def memory_search(query: str, limit: int = 10):
 def learning_export(run_id: str):
     """Export a run for manual review."""
     import json
+    import os
+    import shutil
     from pathlib import Path
+    from .pipeline.capture import RESPONSE_SIDECAR
+    from .pipeline.curation import CurationEngine
 
     config = ConfigLoader.load()
     raw_dir = config.state_dirs["datasets_raw"]
 
-    # Find the run file
+    # Find the run file, newest dated folder first
     run_file = None
-    for date_dir in raw_dir.iterdir():
-        if date_dir.is_dir():
-            potential_run = date_dir / run_id / "run.json"
-            if potential_run.exists():
-                run_file = potential_run
-                break
+    with os.scandir(raw_dir) as it:
+        date_dirs = sorted((e.path for e in it if e.is_dir()), reverse=True)
+    for date_dir in date_dirs:
+        potential_run = Path(date_dir) / run_id / "run.json"
+        if potential_run.exists():
+            run_file = potential_run
+            break
 
     if not run_file:
         console.print(f"[red]Run {run_id} not found.[/red]")
@@ -658,8 +682,13 @@ def learning_export(run_id: str):
     # Export to current directory
     export_path = Path.cwd() / f"{run_id}_export.json"
 
-    with open(run_file, "r") as src, open(export_path, "w") as dst:
-        json.dump(json.load(src), dst, indent=2)
+    if (run_file.parent / RESPONSE_SIDECAR).exists():
+        # The response lives in a sidecar; inline it so the export is self-contained
+        with open(export_path, "w") as dst:
+            json.dump(CurationEngine.load_run(run_file.parent), dst, indent=2)
+    else:
+        # run.json is already written indented, so copy it without re-parsing
+        shutil.copyfile(run_file, export_path)
 
     console.print(f"✓ Exported run {run_id} to {export_path}")
 
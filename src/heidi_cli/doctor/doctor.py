@@ -34,6 +34,29 @@ class HeidiDoctor:
         self.project_root = project_root or Path.cwd()
         self.issues: List[DoctorIssue] = []
         self.console = Console()
+        # Source listing shared by every check in a run
+        self._source_files: Optional[List[Path]] = None
+        # (path, ast.Module or the parse error) for each source file
+        self._source_trees: Optional[List[Tuple[Path, Any]]] = None
+
+    def _python_sources(self) -> List[Path]:
+        """List src/**/*.py once per doctor instance."""
+        if self._source_files is None:
+            self._source_files = list(self.project_root.rglob("src/**/*.py"))
+        return self._source_files
+
+    def _parsed_sources(self) -> List[Tuple[Path, Any]]:
+        """Parse each source file once; files that fail keep the raised exception."""
+        if self._source_trees is None:
+            trees = []
+            for file_path in self._python_sources():
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        trees.append((file_path, ast.parse(f.read())))
+                except Exception as e:
+                    trees.append((file_path, e))
+            self._source_trees = trees
+        return self._source_trees
         
     def run_full_checkup(self) -> Dict[str, Any]:
         """Run comprehensive doctor checks."""
@@ -160,37 +183,30 @@ class HeidiDoctor:
         """Check import consistency and circular dependencies."""
         issues = []
         
-        # Find all Python files
-        python_files = list(self.project_root.rglob("src/**/*.py"))
-        
         # Build import graph
         import_graph = {}
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                tree = ast.parse(content)
-                imports = []
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            imports.append(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            imports.append(node.module)
-                
-                import_graph[str(file_path)] = imports
-            except Exception as e:
+        for file_path, tree in self._parsed_sources():
+            if isinstance(tree, Exception):
                 issues.append(DoctorIssue(
                     severity="warning",
                     category="imports",
                     file_path=str(file_path),
                     line_number=None,
-                    message=f"Could not parse imports: {str(e)}",
+                    message=f"Could not parse imports: {str(tree)}",
                     suggestion="Check file syntax"
                 ))
+                continue
+
+            imports = []
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    for alias in node.names:
+                        imports.append(alias.name)
+                elif isinstance(node, ast.ImportFrom):
+                    if node.module:
+                        imports.append(node.module)
+
+            import_graph[str(file_path)] = imports
         
         # Check for circular dependencies
         visited = set()
@@ -232,71 +248,64 @@ class HeidiDoctor:
         """Check function definitions and signatures."""
         issues = []
         
-        python_files = list(self.project_root.rglob("src/**/*.py"))
-        
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                tree = ast.parse(content)
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        # Check for docstrings
-                        if not ast.get_docstring(node):
-                            issues.append(DoctorIssue(
-                                severity="warning",
-                                category="functions",
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                message=f"Function '{node.name}' missing docstring",
-                                suggestion="Add docstring explaining function purpose"
-                            ))
-                        
-                        # Check for type hints
-                        if not node.returns:
-                            issues.append(DoctorIssue(
-                                severity="info",
-                                category="functions",
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                message=f"Function '{node.name}' missing return type hint",
-                                suggestion="Add return type annotation"
-                            ))
-                        
-                        # Check argument types
-                        for arg in node.args.args:
-                            if arg.annotation is None and arg.arg != 'self':
-                                issues.append(DoctorIssue(
-                                    severity="info",
-                                    category="functions",
-                                    file_path=str(file_path),
-                                    line_number=node.lineno,
-                                    message=f"Argument '{arg.arg}' in function '{node.name}' missing type hint",
-                                    suggestion="Add type annotation"
-                                ))
-                        
-                        # Check for empty functions
-                        if len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
-                            issues.append(DoctorIssue(
-                                severity="warning",
-                                category="functions",
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                message=f"Function '{node.name}' is empty",
-                                suggestion="Implement function or remove placeholder"
-                            ))
-                        
-            except Exception as e:
+        for file_path, tree in self._parsed_sources():
+            if isinstance(tree, Exception):
                 issues.append(DoctorIssue(
                     severity="warning",
                     category="functions",
                     file_path=str(file_path),
                     line_number=None,
-                    message=f"Could not analyze functions: {str(e)}",
+                    message=f"Could not analyze functions: {str(tree)}",
                     suggestion="Check file syntax"
                 ))
+                continue
+
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef):
+                    # Check for docstrings
+                    if not ast.get_docstring(node):
+                        issues.append(DoctorIssue(
+                            severity="warning",
+                            category="functions",
+                            file_path=str(file_path),
+                            line_number=node.lineno,
+                            message=f"Function '{node.name}' missing docstring",
+                            suggestion="Add docstring explaining function purpose"
+                        ))
+                    
+                    # Check for type hints
+                    if not node.returns:
+                        issues.append(DoctorIssue(
+                            severity="info",
+                            category="functions",
+                            file_path=str(file_path),
+                            line_number=node.lineno,
+                            message=f"Function '{node.name}' missing return type hint",
+                            suggestion="Add return type annotation"
+                        ))
+                    
+                    # Check argument types
+                    for arg in node.args.args:
+                        if arg.annotation is None and arg.arg != 'self':
+                            issues.append(DoctorIssue(
+                                severity="info",
+                                category="functions",
+                                file_path=str(file_path),
+                                line_number=node.lineno,
+                                message=f"Argument '{arg.arg}' in function '{node.name}' missing type hint",
+                                suggestion="Add type annotation"
+                            ))
+                    
+                    # Check for empty functions
+                    if len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
+                        issues.append(DoctorIssue(
+                            severity="warning",
+                            category="functions",
+                            file_path=str(file_path),
+                            line_number=node.lineno,
+                            message=f"Function '{node.name}' is empty",
+                            suggestion="Implement function or remove placeholder"
+                        ))
         
         return {"passed": len(issues) == 0, "issues": issues}
     
@@ -306,7 +315,7 @@ class HeidiDoctor:
         
         # Find test files
         test_files = list(self.project_root.rglob("tests/**/*.py"))
-        src_files = list(self.project_root.rglob("src/**/*.py"))
+        src_files = self._python_sources()
         
         if len(test_files) == 0:
             issues.append(DoctorIssue(
@@ -386,23 +395,17 @@ class HeidiDoctor:
                     ))
         
         # Check docstring coverage
-        python_files = list(self.project_root.rglob("src/**/*.py"))
         total_functions = 0
         documented_functions = 0
         
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                        total_functions += 1
-                        if ast.get_docstring(node):
-                            documented_functions += 1
-            except Exception:
-                pass
+        for _, tree in self._parsed_sources():
+            if isinstance(tree, Exception):
+                continue
+            for node in ast.walk(tree):
+                if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                    total_functions += 1
+                    if ast.get_docstring(node):
+                        documented_functions += 1
         
         if total_functions > 0:
             coverage = (documented_functions / total_functions) * 100
@@ -5,6 +5,13 @@ This module provides integrations with external services and platforms
 such as HuggingFace Hub for model discovery and download.
 """
 
-from .huggingface import HuggingFaceIntegration, huggingface_integration
+from importlib import import_module
 
 __all__ = ["HuggingFaceIntegration", "huggingface_integration"]
+
+
+def __getattr__(name):
+    # huggingface_hub is slow to import; only load it when actually used
+    if name in __all__:
+        return getattr(import_module(".huggingface", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Any
@@ -22,6 +23,12 @@ except ImportError:
 
 logger = logging.getLogger("heidi.huggingface")
 
+_CHAT_TAGS = frozenset({"chat", "instruct", "chatglm"})
+_CODING_TAGS = frozenset({"coding", "code", "python", "javascript"})
+_SIZE_TAGS = frozenset({"7b", "13b", "70b", "1.8b", "3b", "30b"})
+_CONFIG_SIZE_TAGS = _SIZE_TAGS | {"1b", "6b"}
+_LANGUAGE_TAGS = frozenset({"english", "chinese", "french", "german", "spanish"})
+
 
 class HuggingFaceIntegration:
     """Integration with HuggingFace Hub for model discovery and download."""
@@ -33,8 +40,6 @@ class HuggingFaceIntegration:
                 "Install with: pip install huggingface_hub>=0.20.0"
             )
 
-        import os
-
         heidi_home = os.environ.get("HEIDI_HOME")
         if heidi_home:
             self.cache_dir = Path(heidi_home) / "models" / "huggingface"
@@ -45,8 +50,6 @@ class HuggingFaceIntegration:
         # Check if token is available
         if not token:
             # Try to get token from environment
-            import os
-
             token = os.environ.get("HUGGINGFACE_TOKEN")
             if token:
                 self.api = HfApi(token=token)
@@ -59,8 +62,12 @@ class HuggingFaceIntegration:
         try:
             models = []
 
-            # Search models without ModelFilter (newer API compatibility)
-            for model_info in self.api.list_models(search=query, limit=limit, sort="downloads"):
+            # Search models without ModelFilter (newer API compatibility); the Hub
+            # client pages lazily over blocking HTTP, so drain it off the event loop
+            results = await asyncio.to_thread(
+                lambda: list(self.api.list_models(search=query, limit=limit, sort="downloads"))
+            )
+            for model_info in results:
                 # Filter for relevant models manually
                 if model_info.pipeline_tag and model_info.pipeline_tag != task_filter:
                     continue
@@ -110,7 +117,7 @@ class HuggingFaceIntegration:
     async def get_model_info(self, model_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific model."""
         try:
-            model_info = self.api.model_info(model_id)
+            model_info = await asyncio.to_thread(self.api.model_info, model_id)
 
             # Extract relevant information with compatibility for different versions
             info = {
@@ -150,18 +157,18 @@ class HuggingFaceIntegration:
             info["languages"] = []
 
             for tag in info["tags"]:
-                if tag in ["chat", "instruct", "chatglm"]:
+                if tag in _CHAT_TAGS:
                     info["capabilities"].append("chat")
-                if tag in ["coding", "code", "python", "javascript"]:
+                if tag in _CODING_TAGS:
                     info["capabilities"].append("coding")
                 if tag.startswith("context-length-"):
                     try:
                         info["context_length"] = int(tag.split("-")[-1])
                     except (ValueError, IndexError):
                         pass
-                if tag in ["7b", "13b", "70b", "1.8b", "3b", "30b"]:
+                if tag in _SIZE_TAGS:
                     info["model_type"] = tag
-                if tag in ["english", "chinese", "french", "german", "spanish"]:
+                if tag in _LANGUAGE_TAGS:
                     info["languages"].append(tag)
 
             # Extract context length from config if available
@@ -223,15 +230,20 @@ class HuggingFaceIntegration:
 
             try:
                 # Try snapshot_download first (more reliable for large models)
-                downloaded_path = snapshot_download(
+                downloaded_path = await asyncio.to_thread(
+                    snapshot_download,
                     repo_id=model_id,
                     cache_dir=model_dir,
                     force_download=force_download,
                     allow_patterns=["*.json", "*.bin", "*.safetensors", "*.model"],
                     ignore_patterns=["*.git*", "*.md"],
                 )
-                downloaded_files = list(Path(downloaded_path).rglob("*"))
-                downloaded_files = [f for f in downloaded_files if f.is_file()]
+                # os.walk classifies entries via scandir's d_type, so no stat per path
+                downloaded_files = [
+                    Path(root, name)
+                    for root, _, names in os.walk(downloaded_path)
+                    for name in names
+                ]
 
             except Exception as e:
                 logger.warning(f"Snapshot download failed, trying individual files: {e}")
@@ -251,7 +263,8 @@ class HuggingFaceIntegration:
 
                 for filename in all_files:
                     try:
-                        file_path = hf_hub_download(
+                        file_path = await asyncio.to_thread(
+                            hf_hub_download,
                             repo_id=model_id,
                             filename=filename,
                             cache_dir=model_dir,
@@ -263,7 +276,12 @@ class HuggingFaceIntegration:
                         continue
 
             # Calculate total size
-            total_size = sum(f.stat().st_size for f in downloaded_files if f.exists())
+            total_size = 0
+            for f in downloaded_files:
+                try:
+                    total_size += f.stat().st_size
+                except OSError:
+                    pass
 
             # Create metadata
             metadata = {
@@ -390,7 +408,7 @@ class HuggingFaceIntegration:
             model_type = None
             tags = model_info.get("tags", [])
             for tag in tags:
-                if tag in ["7b", "13b", "70b", "1.8b", "3b", "30b", "1b", "6b"]:
+                if tag in _CONFIG_SIZE_TAGS:
                     model_type = tag
                     break
             config["model_type"] = model_type
@@ -479,34 +497,38 @@ class HuggingFaceIntegration:
         """List all locally downloaded HuggingFace models."""
         local_models = []
 
-        if not self.cache_dir.exists():
+        try:
+            with os.scandir(self.cache_dir) as it:
+                entries = [e for e in it if e.is_dir()]
+        except FileNotFoundError:
             return local_models
 
-        for model_dir in self.cache_dir.iterdir():
-            if model_dir.is_dir():
-                metadata_file = model_dir / "heidi_metadata.json"
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, "r") as f:
-                            metadata = json.load(f)
-                        local_models.append(metadata)
-                    except (json.JSONDecodeError, Exception) as e:
-                        logger.warning(f"Error reading metadata for {model_dir.name}: {e}")
-                        # Try to create basic metadata from directory structure
-                        try:
-                            basic_metadata = {
-                                "model_id": model_dir.name.replace("_", "/"),
-                                "safe_id": model_dir.name,
-                                "downloaded_at": "Unknown",
-                                "local_path": str(model_dir),
-                                "files": [],
-                                "file_count": 0,
-                                "size_bytes": 0,
-                                "size_gb": 0.0,
-                            }
-                            local_models.append(basic_metadata)
-                        except Exception:
-                            continue
+        for entry in entries:
+            model_dir = Path(entry.path)
+            metadata_file = model_dir / "heidi_metadata.json"
+            try:
+                with open(metadata_file, "r") as f:
+                    metadata = json.load(f)
+                local_models.append(metadata)
+            except FileNotFoundError:
+                continue
+            except (json.JSONDecodeError, Exception) as e:
+                logger.warning(f"Error reading metadata for {model_dir.name}: {e}")
+                # Try to create basic metadata from directory structure
+                try:
+                    basic_metadata = {
+                        "model_id": model_dir.name.replace("_", "/"),
+                        "safe_id": model_dir.name,
+                        "downloaded_at": "Unknown",
+                        "local_path": str(model_dir),
+                        "files": [],
+                        "file_count": 0,
+                        "size_bytes": 0,
+                        "size_gb": 0.0,
+                    }
+                    local_models.append(basic_metadata)
+                except Exception:
+                    continue
 
         return sorted(local_models, key=lambda x: x.get("downloaded_at", ""), reverse=True)
 
@@ -515,12 +537,13 @@ class HuggingFaceIntegration:
         safe_model_id = model_id.replace("/", "_").replace("\\", "_")
         metadata_file = self.cache_dir / safe_model_id / "heidi_metadata.json"
 
-        if metadata_file.exists():
-            try:
-                with open(metadata_file, "r") as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error reading metadata for {model_id}: {e}")
+        try:
+            with open(metadata_file, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error reading metadata for {model_id}: {e}")
 
         return None
 
@@ -6,34 +6,37 @@ import signal
 import subprocess
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 
 from rich.console import Console
 from .shared.config import ConfigLoader
+from .shared.storage import atomic_write_json
 
 console = Console()
 
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a state directory once per process."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 def get_pids_file() -> Path:
     """Get the PID file path from suite data root."""
     config = ConfigLoader.load()
-    pid_dir = config.data_root / "registry"
-    pid_dir.mkdir(parents=True, exist_ok=True)
-    return pid_dir / "pids.json"
+    return _ensure_dir(config.data_root / "registry") / "pids.json"
 
 def load_pids() -> Dict[str, int]:
     """Load PIDs from file."""
-    pids_file = get_pids_file()
-    if pids_file.exists():
-        try:
-            return json.loads(pids_file.read_text())
-        except Exception:
-            return {}
-    return {}
+    try:
+        return json.loads(get_pids_file().read_bytes())
+    except Exception:
+        return {}
 
 def save_pids(pids: Dict[str, int]) -> None:
     """Save PIDs to file."""
-    get_pids_file().write_text(json.dumps(pids, indent=2))
+    atomic_write_json(get_pids_file(), pids)
 
 def add_pid(name: str, pid: int) -> None:
     """Add a PID to the tracking file."""
@@ -47,6 +50,35 @@ def remove_pid(name: str) -> None:
     pids.pop(name, None)
     save_pids(pids)
 
+def _wait_for_exit(pid: int, timeout: float, interval: float = 0.05) -> bool:
+    """Poll until a process exits, returning False if it is still alive at the deadline."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+def wait_for_http(url: str, timeout: float, interval: float = 0.1) -> bool:
+    """Poll a health URL until it answers 200, returning False if it never does by the deadline."""
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    # A refused loopback connect is immediate; don't let a dead host eat the read timeout
+    with httpx.Client(timeout=httpx.Timeout(1.0, connect=0.2)) as client:
+        while True:
+            try:
+                if client.get(url).status_code == 200:
+                    return True
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
 def stop_process(name: str) -> bool:
     """Stop a managed process."""
     pids = load_pids()
@@ -56,12 +88,11 @@ def stop_process(name: str) -> bool:
     
     try:
         os.kill(pid, signal.SIGTERM)
-        time.sleep(1)
-        try:
-            os.kill(pid, 0)
-            os.kill(pid, signal.SIGKILL)
-        except OSError:
-            pass
+        if not _wait_for_exit(pid, timeout=1.0):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
         remove_pid(name)
         return True
     except OSError:
@@ -71,8 +102,7 @@ def stop_process(name: str) -> bool:
 def start_daemon(name: str, cmd: list[str], log_name: str) -> int:
     """Start a command as a daemon process."""
     config = ConfigLoader.load()
-    log_dir = config.data_root / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
+    log_dir = _ensure_dir(config.data_root / "logs")
     
     log_file = log_dir / log_name
     log_fd = open(log_file, "w")
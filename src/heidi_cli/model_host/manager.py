@@ -1,23 +1,35 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import importlib.util
 import logging
 import os
+import re
 import httpx
 import time
 import threading
 import uuid
+from collections.abc import Mapping
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional, AsyncGenerator
 import psutil
 from ..shared.config import ConfigLoader, ModelConfig
+from ..shared.serialization import dumps, loads
 from .metadata import metadata_manager, ModelStatus, ModelMetrics, ModelProvider
 from ..integrations.analytics import get_analytics
 from ..token_tracking.models import get_token_database, TokenUsage
 
 logger = logging.getLogger("heidi.model_host")
 
+# /v1/models is polled by UIs; metadata only drifts via per-request metrics
+MODELS_CACHE_TTL = 10.0
+# Per-request memory checks share one psutil sample for this long
+MEMORY_SAMPLE_TTL = 1.0
+# Prompts that trigger the autonomous-mode override in _validate_and_fix_messages
+_AGENTIC_PROMPT_RE = re.compile(r"analyze|execute|implement|plan", re.IGNORECASE)
+
 # Lazy imports for transformers
 torch = None
 transformers = None
@@ -68,6 +80,15 @@ class ModelManager:
         self.max_memory_gb = getattr(self.config, "max_memory_gb", 8)
         self.max_concurrent_requests = getattr(self.config, "max_concurrent_requests", 10)
         self._active_requests = 0
+        self.max_concurrent_generations = getattr(self.config, "max_concurrent_generations", 1)
+        # model.generate runs in worker threads; bound how many share the model at once
+        self._generate_semaphore: Optional[asyncio.Semaphore] = None
+        # Serializes unload/reload while they drain every generation slot
+        self._swap_lock: Optional[asyncio.Lock] = None
+        # (built_at, models) for list_models
+        self._models_cache: Optional[tuple] = None
+        # (sampled_at, psutil.virtual_memory()) for _virtual_memory
+        self._memory_sample: Optional[tuple] = None
 
         # Security settings
         self.allowed_model_paths = getattr(
@@ -80,6 +101,8 @@ class ModelManager:
                 Path("/media/heidi/New Volume/hf-hub/merged"),
             ],
         )
+        # (allowed_model_paths list, resolved roots) for _validate_model_path
+        self._allowed_paths_cache: Optional[tuple] = None
 
         # Lazy load model only when requested
         self.model_loaded = False
@@ -101,12 +124,32 @@ class ModelManager:
             self.opencode_client = httpx.AsyncClient(
                 base_url="https://api.opencode.ai",
                 headers={"Authorization": f"Bearer {api_key}"},
-                timeout=60.0,
+                # Long reads for generation, but fail fast when the API is unreachable
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                # One pooled client serves every OpenCode request; keep connections warm
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                # Multiplex concurrent requests over one connection when h2 is installed
+                http2=importlib.util.find_spec("h2") is not None,
             )
             logger.info("OpenCode API client initialized")
         else:
             logger.info("OpenCode API key not found, using local models only")
 
+    async def aclose(self):
+        """Close the pooled OpenCode client."""
+        if self.opencode_client is not None:
+            await self.opencode_client.aclose()
+            self.opencode_client = None
+
+    def _resolved_allowed_paths(self) -> List[Path]:
+        """Resolve the allowed model roots once per configured list."""
+        paths = self.allowed_model_paths
+        cached = self._allowed_paths_cache
+        if cached is None or cached[0] is not paths:
+            cached = (paths, [p.resolve() for p in paths])
+            self._allowed_paths_cache = cached
+        return cached[1]
+
     def _validate_model_path(self, model_path: Path) -> bool:
         """Validate model path for security."""
         try:
@@ -114,14 +157,14 @@ class ModelManager:
             abs_path = model_path.resolve()
 
             # Check if path is within allowed directories
-            for allowed_path in self.allowed_model_paths:
+            for allowed_path in self._resolved_allowed_paths():
                 if allowed_path.exists():
                     try:
-                        if abs_path.is_relative_to(allowed_path.resolve()):
+                        if abs_path.is_relative_to(allowed_path):
                             return True
                     except AttributeError:
                         # Fallback for older Python versions
-                        if str(abs_path).startswith(str(allowed_path.resolve())):
+                        if str(abs_path).startswith(str(allowed_path)):
                             return True
 
             logger.warning(f"Model path not in allowed directories: {abs_path}")
@@ -130,10 +173,19 @@ class ModelManager:
             logger.error(f"Error validating model path: {e}")
             return False
 
+    def _virtual_memory(self):
+        """Return psutil.virtual_memory(), re-sampled at most every MEMORY_SAMPLE_TTL seconds."""
+        now = time.monotonic()
+        sample = self._memory_sample
+        if sample is None or now - sample[0] >= MEMORY_SAMPLE_TTL:
+            sample = (now, psutil.virtual_memory())
+            self._memory_sample = sample
+        return sample[1]
+
     def _check_memory_usage(self) -> bool:
         """Check if memory usage is within limits."""
         try:
-            memory_info = psutil.virtual_memory()
+            memory_info = self._virtual_memory()
             used_gb = memory_info.used / (1024**3)
 
             if used_gb > self.max_memory_gb:
@@ -153,13 +205,12 @@ class ModelManager:
         with self._lock:
             try:
                 registry_path = self.config.data_root / "registry" / "registry.json"
-                if not registry_path.exists():
+                try:
+                    registry = loads(registry_path.read_bytes())
+                except FileNotFoundError:
                     logger.warning(f"Registry not found at {registry_path}, model not loaded")
                     return
 
-                with open(registry_path) as f:
-                    registry = json.load(f)
-
                 active_version = registry.get("active_stable")
                 if not active_version:
                     logger.warning("No active_stable version in registry")
@@ -240,6 +291,7 @@ class ModelManager:
 
                 logger.info(f"Model loaded successfully: {active_version}")
                 self.model_loaded = True
+                self._models_cache = None
 
             except Exception as e:
                 logger.error(f"Failed to load model: {e}")
@@ -249,6 +301,17 @@ class ModelManager:
 
     def list_models(self) -> List[Dict[str, Any]]:
         """List routable models for /v1/models with enhanced metadata."""
+        now = time.monotonic()
+        cached = self._models_cache
+        if cached is not None and now - cached[0] < MODELS_CACHE_TTL:
+            return list(cached[1])
+
+        models = self._build_model_list()
+        self._models_cache = (now, models)
+        return list(models)
+
+    def _build_model_list(self) -> List[Dict[str, Any]]:
+        """Build the /v1/models entries from the metadata catalog."""
         models = []
 
         # Get all models from metadata manager
@@ -329,14 +392,10 @@ class ModelManager:
 
         with self._lock:
             # Check concurrent request limit
-            if hasattr(self, "_active_requests") and self._active_requests >= getattr(
-                self, "max_concurrent_requests", 10
-            ):
+            if self._active_requests >= self.max_concurrent_requests:
                 logger.warning(f"Too many concurrent requests: {self._active_requests}")
                 return self._fallback_response(model_id, messages, "Server overloaded")
 
-            if not hasattr(self, "_active_requests"):
-                self._active_requests = 0
             self._active_requests += 1
 
         # Get analytics instance
@@ -402,8 +461,7 @@ class ModelManager:
         finally:
             # CRITICAL: Always decrement the active requests counter
             with self._lock:
-                if hasattr(self, "_active_requests"):
-                    self._active_requests = max(0, self._active_requests - 1)
+                self._active_requests = max(0, self._active_requests - 1)
 
     def _fallback_response(self, model_id: str, messages: List[Dict[str, str]]) -> Dict[str, Any]:
         """Fallback response when model is not available."""
@@ -524,11 +582,11 @@ class ModelManager:
                     {"index": 0, "delta": {"content": response_text}, "finish_reason": None}
                 ],
             }
-            yield json.dumps(chunk)
+            yield dumps(chunk)
 
             # Final chunk
             chunk["choices"][0]["finish_reason"] = "stop"
-            yield json.dumps(chunk)
+            yield dumps(chunk)
             return
 
         # For local models, we'll simulate streaming by generating full response first
@@ -536,36 +594,39 @@ class ModelManager:
         full_response = await self.get_response(model_id, messages, **kwargs)
         content = full_response["choices"][0]["message"]["content"]
 
-        # Split content into words for streaming effect
-        words = content.split()
-        for i, word in enumerate(words):
-            chunk = {
+        # Every delta chunk shares the same envelope, so serialize it once and
+        # only encode the content per word
+        head = dumps(
+            {
                 "id": f"chatcmpl-{model_id}",
                 "object": "chat.completion.chunk",
                 "created": 1677610602,
                 "model": model_id,
-                "choices": [
-                    {
-                        "index": 0,
-                        "delta": {"content": word + (" " if i < len(words) - 1 else "")},
-                        "finish_reason": None,
-                    }
-                ],
             }
-            yield json.dumps(chunk)
+        )
+        prefix = head[:-1] + ',"choices":[{"index":0,"delta":{"content":'
+        suffix = '},"finish_reason":null}]}'
+
+        # Split content into words for streaming effect
+        words = content.split()
+        last = len(words) - 1
+        for i, word in enumerate(words):
+            yield prefix + dumps(word + (" " if i < last else "")) + suffix
 
         # Final chunk
-        chunk["choices"][0]["delta"] = {}
-        chunk["choices"][0]["finish_reason"] = "stop"
-        yield json.dumps(chunk)
+        yield head[:-1] + ',"choices":[{"index":0,"delta":{},"finish_reason":"stop"}]}'
 
     async def _get_local_response(
         self, model_id: str, messages: List[Dict[str, str]], **kwargs
     ) -> Dict[str, Any]:
         """Get response from local model with enhanced parameters."""
+        # Hold a generation slot for the whole request so unload/reload wait for it
+        gate = self._generation_gate()
+        await gate.acquire()
         try:
-            # Check if model is loaded
-            if self.model is None or self.tokenizer is None:
+            # Unload/reload swap these attributes; keep this request's references
+            model, tokenizer = self.model, self.tokenizer
+            if model is None or tokenizer is None:
                 logger.warning("Model not loaded, using fallback response")
                 return self._fallback_response(model_id, messages, "Model not loaded")
 
@@ -591,26 +652,24 @@ class ModelManager:
 
             # Use chat template
             logger.info("Applying chat template...")
-            inputs = self.tokenizer.apply_chat_template(
+            inputs = tokenizer.apply_chat_template(
                 messages, tokenize=True, return_tensors="pt"
             )
             
             # Fix: handle both tensor and dict-like inputs (BatchEncoding)
-            from collections.abc import Mapping
-            
             if isinstance(inputs, Mapping):
                 input_ids = inputs.get("input_ids")
                 if input_ids is not None:
                     logger.info(f"Input size: {input_ids.size()}")
                 
                 # Move all tensors in the mapping to the device
-                device = next(self.model.parameters()).device
+                device = next(model.parameters()).device
                 logger.info(f"Model device: {device}")
                 inputs = {k: v.to(device) if hasattr(v, "to") else v for k, v in inputs.items()}
             else:
                 # Direct tensor input
                 logger.info(f"Input size: {inputs.size() if hasattr(inputs, 'size') else 'unknown'}")
-                device = next(self.model.parameters()).device
+                device = next(model.parameters()).device
                 inputs = inputs.to(device)
             
             logger.info("Moved inputs to device")
@@ -620,9 +679,9 @@ class ModelManager:
                 "max_new_tokens": kwargs.get("max_tokens", 128),
                 "do_sample": True,
                 "temperature": kwargs.get("temperature", 0.7),
-                "pad_token_id": self.tokenizer.pad_token_id
-                if self.tokenizer.pad_token_id is not None
-                else self.tokenizer.eos_token_id,
+                "pad_token_id": tokenizer.pad_token_id
+                if tokenizer.pad_token_id is not None
+                else tokenizer.eos_token_id,
             }
 
             top_p = kwargs.get("top_p")
@@ -635,20 +694,19 @@ class ModelManager:
 
             logger.info(f"Generating with config: {gen_kwargs}")
             if isinstance(inputs, Mapping):
-                outputs = self.model.generate(**inputs, **gen_kwargs)
+                outputs = await asyncio.to_thread(model.generate, **inputs, **gen_kwargs)
             else:
-                outputs = self.model.generate(inputs, **gen_kwargs)
+                outputs = await asyncio.to_thread(model.generate, inputs, **gen_kwargs)
             logger.info(f"Generated output shape: {outputs.shape}")
 
             # Decode only the new tokens (skip input)
-            from collections.abc import Mapping
             if isinstance(inputs, Mapping):
                 input_length = inputs["input_ids"].shape[1]
             else:
                 input_length = inputs.shape[1]
                 
             response_tokens = outputs[0][input_length:]
-            response_text = self.tokenizer.decode(response_tokens, skip_special_tokens=True)
+            response_text = tokenizer.decode(response_tokens, skip_special_tokens=True)
 
             # Create response
             response = {
@@ -699,6 +757,31 @@ class ModelManager:
             logger.error(f"Error during local model inference: {e}")
             logger.error(f"Traceback: {traceback.format_exc()}")
             return self._fallback_response(model_id, messages)
+        finally:
+            gate.release()
+
+    def _generation_gate(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent local generations."""
+        if self._generate_semaphore is None:
+            self._generate_semaphore = asyncio.Semaphore(self.max_concurrent_generations)
+        return self._generate_semaphore
+
+    @asynccontextmanager
+    async def _idle_model(self):
+        """Hold every generation slot so the model can be swapped with no request using it."""
+        gate = self._generation_gate()
+        if self._swap_lock is None:
+            self._swap_lock = asyncio.Lock()
+        async with self._swap_lock:
+            acquired = 0
+            try:
+                for _ in range(self.max_concurrent_generations):
+                    await gate.acquire()
+                    acquired += 1
+                yield
+            finally:
+                for _ in range(acquired):
+                    gate.release()
 
     def _update_model_metrics(self, model_id: str, response_time: float, success: bool):
         """Update metrics for a specific model"""
@@ -810,6 +893,8 @@ class ModelManager:
                     self.tokenizer = None
 
                 self.model_path = None
+                # /v1/models and /health must not keep reporting the unloaded model
+                self._models_cache = None
 
                 # Force garbage collection
                 import gc
@@ -834,6 +919,16 @@ class ModelManager:
         self.unload_model()
         self._load_model_from_registry()
 
+    async def unload_model_when_idle(self):
+        """Unload the model once in-flight generations finish, off the event loop."""
+        async with self._idle_model():
+            await asyncio.to_thread(self.unload_model)
+
+    async def reload_model_when_idle(self):
+        """Reload the model once in-flight generations finish, off the event loop."""
+        async with self._idle_model():
+            await asyncio.to_thread(self.reload_model)
+
     def _record_token_usage(
         self,
         model_id: str,
@@ -882,7 +977,7 @@ class ModelManager:
     def get_resource_status(self) -> Dict[str, Any]:
         """Get current resource usage status."""
         try:
-            memory = psutil.virtual_memory()
+            memory = self._virtual_memory()
             return {
                 "memory_used_gb": memory.used / (1024**3),
                 "memory_available_gb": memory.available / (1024**3),
@@ -961,7 +1056,7 @@ class ModelManager:
         if final_messages and final_messages[-1]["role"] == "user":
             content = final_messages[-1]["content"]
             # Only inject if the message seems complex or agentic
-            if "analyze" in content.lower() or "execute" in content.lower() or "implement" in content.lower() or "plan" in content.lower():
+            if _AGENTIC_PROMPT_RE.search(content):
                 override = """
 [CRITICAL SYSTEM OVERRIDE: SUPER LEGEND AUTONOMOUS MODE]
 YOU ARE AN AUTONOMOUS AGENT. DO NOT be conversational. DO NOT apologize or say what you *would* do.
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import time
 import logging
 import threading
 import asyncio
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Awaitable
 from dataclasses import dataclass, field
 from functools import lru_cache
 from collections import OrderedDict
@@ -76,10 +77,10 @@ class PerformanceOptimizer:
         self._lock = threading.Lock()
         self.request_times: Dict[str, list] = {}
         self.enabled = True
+        # In-flight work keyed like the response cache, for coalesce()
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     def cache_key_from_messages(self, messages: list, model_id: str, **kwargs) -> str:
-        import hashlib
-
         content = f"{model_id}:{messages}:{sorted(kwargs.items())}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
@@ -93,6 +94,16 @@ class PerformanceOptimizer:
             return
         self.response_cache.set(cache_key, response, ttl=ttl)
 
+    async def coalesce(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory once for concurrent callers sharing key and hand all of them its result."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller disconnecting does not cancel the shared work
+        return await asyncio.shield(task)
+
     def track_request_time(self, model_id: str, duration_ms: float):
         with self._lock:
             if model_id not in self.request_times:
@@ -171,10 +182,11 @@ class PerformanceOptimizer:
 
 
 class AsyncBatchProcessor:
-    def __init__(self, batch_size: int = 10, timeout: float = 1.0):
+    def __init__(self, batch_size: int = 10, timeout: float = 1.0, max_pending: int = 256):
         self.batch_size = batch_size
         self.timeout = timeout
-        self.queue: asyncio.Queue = asyncio.Queue()
+        # Bounded so producers wait instead of growing the backlog without limit
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
         self.processing = False
 
     async def add(self, item: Any) -> Any:
@@ -187,13 +199,23 @@ class AsyncBatchProcessor:
         batch = []
         futures = []
 
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 0.1
+
         while len(batch) < self.batch_size:
+            # Drain what is already queued without arming a timer per item
             try:
-                item, future = await asyncio.wait_for(self.queue.get(), timeout=0.1)
-                batch.append(item)
-                futures.append(future)
-            except asyncio.TimeoutError:
-                break
+                item, future = self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item, future = await asyncio.wait_for(self.queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            batch.append(item)
+            futures.append(future)
 
         if batch:
             results = await handler(batch)
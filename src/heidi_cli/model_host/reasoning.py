@@ -9,6 +9,16 @@ from datetime import datetime
 
 logger = logging.getLogger("heidi.reasoning")
 
+_BRIEF_ANALYSIS_TMPL = "Analyzing request: {head}..."
+_DECOMPOSE_TMPL = "Decomposing request: {prompt}"
+
+_REQUEST_KEYWORDS = (
+    ("factual_query", ("what", "who", "where", "when", "how")),
+    ("creative_task", ("write", "create", "make", "generate")),
+    ("computation", ("calculate", "compute", "solve")),
+    ("coding", ("code", "program", "function")),
+)
+
 
 class ReasoningLevel(Enum):
     NONE = "none"
@@ -73,7 +83,7 @@ class ReasoningEngine:
 
         if level == ReasoningLevel.BRIEF:
             trace.add_step(
-                thought=f"Analyzing request: {prompt[:100]}...",
+                thought=_BRIEF_ANALYSIS_TMPL.format_map({"head": prompt[:100]}),
                 action="Understand intent",
                 observation=f"Request type: {self._classify_request(prompt)}",
             )
@@ -87,7 +97,7 @@ class ReasoningEngine:
 
         elif level == ReasoningLevel.DETAILED:
             trace.add_step(
-                thought=f"Decomposing request: {prompt}",
+                thought=_DECOMPOSE_TMPL.format_map({"prompt": prompt}),
                 action="Parse request",
                 observation="Identified key components",
             )
@@ -139,16 +149,10 @@ class ReasoningEngine:
     def _classify_request(self, prompt: str) -> str:
         prompt_lower = prompt.lower()
 
-        if any(kw in prompt_lower for kw in ["what", "who", "where", "when", "how"]):
-            return "factual_query"
-        elif any(kw in prompt_lower for kw in ["write", "create", "make", "generate"]):
-            return "creative_task"
-        elif any(kw in prompt_lower for kw in ["calculate", "compute", "solve"]):
-            return "computation"
-        elif any(kw in prompt_lower for kw in ["code", "program", "function"]):
-            return "coding"
-        else:
-            return "general"
+        for category, keywords in _REQUEST_KEYWORDS:
+            if any(kw in prompt_lower for kw in keywords):
+                return category
+        return "general"
 
     def _extract_entities(self, text: str) -> List[str]:
         entities = []
@@ -1,26 +1,43 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import uuid
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import List, Optional, AsyncGenerator, Dict, Any, Union
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 from .manager import manager
 from .tools import get_tool_registry, ToolCall
 from .structured import get_structured_generator, ResponseFormat
 from .reasoning import get_reasoning_engine, ReasoningLevel
 from .performance import get_performance_optimizer
-from ..shared.config import ConfigLoader
+from ..shared.config import ConfigLoader, get_worker_threads
+from ..shared.middleware import add_gzip_middleware
+from ..shared.serialization import dumps_bytes, loads
 from ..token_tracking.models import get_token_database
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("heidi.model_host")
 
 app = FastAPI(title="Heidi Local Model Host")
+# Compress large JSON bodies (model lists, usage history); SSE streams are left alone
+add_gzip_middleware(app)
+
+# Serialized /v1/tools body, keyed on the registry's cached tool list
+_tools_body: Optional[tuple] = None
+# Headers for streamed completions; Starlette copies them into each response
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+_SSE_DONE = b"data: [DONE]\n\n"
+# In-flight /v1/model/reload, so repeated calls don't stack reloads
+_reload_task: Optional[asyncio.Task] = None
 
 
 class ChatMessage(BaseModel):
@@ -162,22 +179,28 @@ async def get_model(model_id: str):
 async def unload_model(request: ModelUnloadRequest):
     """Unload the currently loaded model."""
     try:
-        manager.unload_model()
+        await manager.unload_model_when_idle()
         return {"message": "Model unloaded successfully"}
     except Exception as e:
         logging.error(f"Error unloading model: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/v1/model/reload")
-async def reload_model():
-    """Reload model from registry."""
+async def _reload_model_in_background():
     try:
-        manager.reload_model()
-        return {"message": "Model reload initiated"}
+        await manager.reload_model_when_idle()
     except Exception as e:
-        logging.error(f"Error reloading model: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.error(f"Error reloading model: {e}")
+
+
+@app.post("/v1/model/reload", status_code=202)
+async def reload_model():
+    """Reload model from registry in the background."""
+    global _reload_task
+    if _reload_task is None or _reload_task.done():
+        _reload_task = asyncio.create_task(_reload_model_in_background())
+        return {"message": "Model reload initiated"}
+    return {"message": "Model reload already in progress"}
 
 
 @app.post("/v1/tokens/usage")
@@ -189,11 +212,10 @@ async def get_token_usage(request: TokenUsageRequest):
         # Build filters
         start_date = None
         if request.days:
-            from datetime import timedelta
-
             start_date = datetime.utcnow() - timedelta(days=request.days)
 
-        history = db.get_usage_history(
+        history = await asyncio.to_thread(
+            db.get_usage_history,
             limit=request.limit or 100,
             model_id=request.model_id,
             session_id=request.session_id,
@@ -214,7 +236,9 @@ async def get_token_summary(
     """Get token usage summary."""
     try:
         db = get_token_database()
-        summary = db.get_usage_summary(period=period, model_id=model, user_id=user)
+        summary = await asyncio.to_thread(
+            db.get_usage_summary, period=period, model_id=model, user_id=user
+        )
         return summary
     except Exception as e:
         logging.error(f"Error getting token summary: {e}")
@@ -228,38 +252,25 @@ async def get_token_stats(days: int = 30, model: Optional[str] = None, user: Opt
         db = get_token_database()
 
         # Get data for the period
-        from datetime import timedelta
-
         start_date = datetime.utcnow() - timedelta(days=days)
-        history = db.get_usage_history(
-            limit=10000,  # Large limit for analytics
-            start_date=start_date,
-            model_id=model,
-            user_id=user,
+        # Aggregate in SQLite rather than materializing every usage row
+        model_stats = await asyncio.to_thread(
+            db.get_usage_by_model, start_date, model_id=model, user_id=user
         )
 
-        if not history:
+        if not model_stats:
             return {"message": "No usage data found"}
 
         # Calculate statistics
-        total_requests = len(history)
-        total_tokens = sum(h.total_tokens for h in history)
-        total_cost = sum(h.cost_usd for h in history)
+        total_requests = sum(m["requests"] for m in model_stats.values())
+        total_tokens = sum(m["tokens"] for m in model_stats.values())
+        total_cost = sum(m["cost"] for m in model_stats.values())
 
         # Daily averages
         avg_daily_requests = total_requests / days
         avg_daily_tokens = total_tokens / days
         avg_daily_cost = total_cost / days
 
-        # Model breakdown
-        model_stats = {}
-        for usage in history:
-            if usage.model_id not in model_stats:
-                model_stats[usage.model_id] = {"requests": 0, "tokens": 0, "cost": 0.0}
-            model_stats[usage.model_id]["requests"] += 1
-            model_stats[usage.model_id]["tokens"] += usage.total_tokens
-            model_stats[usage.model_id]["cost"] += usage.cost_usd
-
         return {
             "period_days": days,
             "total": {
@@ -308,7 +319,7 @@ async def chat_completions(request: ChatCompletionRequest, http_request: Request
             return StreamingResponse(
                 stream_chat_completion(request),
                 media_type="text/event-stream",
-                headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+                headers=_SSE_HEADERS,
             )
         else:
             response = await manager.get_response(
@@ -328,7 +339,7 @@ async def chat_completions(request: ChatCompletionRequest, http_request: Request
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-async def stream_chat_completion(request: ChatCompletionRequest) -> AsyncGenerator[str, None]:
+async def stream_chat_completion(request: ChatCompletionRequest) -> AsyncGenerator[bytes, None]:
     """Stream chat completion response."""
     try:
         async for chunk in manager.stream_response(
@@ -341,26 +352,33 @@ async def stream_chat_completion(request: ChatCompletionRequest) -> AsyncGenerat
             frequency_penalty=request.frequency_penalty,
             presence_penalty=request.presence_penalty,
         ):
-            yield f"data: {chunk}\n\n"
-        yield "data: [DONE]\n\n"
+            # Hand Starlette ready-made bytes so it doesn't re-encode every event
+            yield b"data: " + chunk.encode("utf-8") + b"\n\n"
+        yield _SSE_DONE
     except Exception as e:
         logger.error(f"Streaming error: {e}")
         error_chunk = {"error": {"message": str(e), "type": "internal_error"}}
-        yield f"data: {json.dumps(error_chunk)}\n\n"
+        yield b"data: " + dumps_bytes(error_chunk) + b"\n\n"
 
 
 @app.get("/v1/tools")
 async def list_tools():
     """List available tools for function calling."""
-    tool_registry = get_tool_registry()
-    return {"object": "list", "data": tool_registry.list_tools()}
+    global _tools_body
+    tools = get_tool_registry().list_tools()
+    if _tools_body is None or _tools_body[0] is not tools:
+        _tools_body = (tools, dumps_bytes({"object": "list", "data": tools}))
+    return Response(content=_tools_body[1], media_type="application/json")
 
 
 @app.post("/v1/tools/call")
 async def call_tools(request: Request):
     """Execute tool calls."""
-    body = await request.json()
-    tool_calls = body.get("tool_calls", [])
+    try:
+        body = loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    tool_calls = body.get("tool_calls", []) if isinstance(body, dict) else []
 
     if not tool_calls:
         raise HTTPException(status_code=400, detail="No tool calls provided")
@@ -372,7 +390,7 @@ async def call_tools(request: Request):
         tool_call = ToolCall(
             id=tc.get("id", str(uuid.uuid4())),
             name=tc["function"]["name"],
-            arguments=json.loads(tc["function"]["arguments"])
+            arguments=loads(tc["function"]["arguments"])
             if isinstance(tc["function"]["arguments"], str)
             else tc["function"]["arguments"],
         )
@@ -458,12 +476,21 @@ async def chat_with_reasoning(request: ChatCompletionRequest):
         "high": ReasoningLevel.VERBOSE,
     }.get(request.reasoning_effort or "low", ReasoningLevel.BRIEF)
 
-    start_time = time.time()
-
-    try:
+    messages = [m.model_dump() for m in request.messages]
+    cache_key = perf.cache_key_from_messages(
+        messages,
+        request.model,
+        temperature=request.temperature,
+        max_tokens=request.max_tokens,
+        top_p=request.top_p,
+        reasoning=request.reasoning_effort,
+    )
+
+    async def generate() -> Dict[str, Any]:
+        start_time = time.time()
         response = await manager.get_response(
             model_id=request.model,
-            messages=[m.model_dump() for m in request.messages],
+            messages=messages,
             temperature=request.temperature,
             max_tokens=request.max_tokens,
             top_p=request.top_p,
@@ -485,16 +512,22 @@ async def chat_with_reasoning(request: ChatCompletionRequest):
                 "thinking_time_ms": reasoning_trace.total_thinking_time_ms,
             },
         }
+        if deterministic:
+            perf.cache_response(cache_key, result)
+        return result
 
-        cache_key = perf.cache_key_from_messages(
-            [m.model_dump() for m in request.messages],
-            request.model,
-            temperature=request.temperature,
-            reasoning=request.reasoning_effort,
-        )
-        perf.cache_response(cache_key, result)
+    # Sampled completions must stay independent; only greedy (temperature 0)
+    # requests may be answered from the cache or share a generation
+    deterministic = request.temperature == 0
 
-        return result
+    try:
+        if not deterministic:
+            return await generate()
+        result = perf.get_cached_response(cache_key)
+        if result is None:
+            # Identical requests arriving together share one generation
+            result = await perf.coalesce(cache_key, generate)
+        return {**result, "id": f"chatcmpl-reason-{uuid.uuid4().hex[:8]}"}
 
     except Exception as e:
         logger.error(f"Reasoning error: {e}")
@@ -529,6 +562,12 @@ async def extended_health():
 @app.on_event("startup")
 async def startup_event():
     logger.info("Heidi Model Host booting...")
+    threads = get_worker_threads()
+    if threads:
+        # Size the pool behind asyncio.to_thread so long generations run in parallel
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=threads, thread_name_prefix="heidi-worker")
+        )
     config = ConfigLoader.load()
     logger.info(f"Configuration loaded. Serving {len(config.models)} models.")
     for m in config.models:
@@ -542,3 +581,4 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Heidi Model Host shutting down...")
+    await manager.aclose()
@@ -10,6 +10,28 @@ import logging
 
 logger = logging.getLogger("heidi.structured")
 
+_JSON_PROMPT_TMPL = """{prompt}
+
+IMPORTANT: Your response MUST be valid JSON matching this schema:
+```json
+{schema}
+```
+
+Respond ONLY with JSON. No additional text."""
+
+# <tag>value</tag> pairs pulled out by _parse_xml
+_XML_TAG_RE = re.compile(r"<(\w+)>(.*?)</\1>")
+
+_TYPE_MAP: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
 
 class OutputFormat(Enum):
     JSON = "json"
@@ -93,33 +115,16 @@ class StructuredOutputGenerator:
         if expected_type is None:
             return True
 
-        type_map = {
-            "string": str,
-            "integer": int,
-            "number": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-            "null": type(None),
-        }
-
-        expected_python_type = type_map.get(expected_type)
+        expected_python_type = _TYPE_MAP.get(expected_type)
         if expected_python_type is None:
             return True
 
         return isinstance(value, expected_python_type)
 
     def generate_json_prompt(self, schema: Dict[str, Any], prompt: str) -> str:
-        schema_str = json.dumps(schema, indent=2)
-
-        return f"""{prompt}
-
-IMPORTANT: Your response MUST be valid JSON matching this schema:
-```json
-{schema_str}
-```
-
-Respond ONLY with JSON. No additional text."""
+        return _JSON_PROMPT_TMPL.format_map(
+            {"prompt": prompt, "schema": json.dumps(schema, indent=2)}
+        )
 
     def extract_structured_data(self, text: str, format_type: OutputFormat) -> Dict[str, Any]:
         if format_type == OutputFormat.JSON or format_type == OutputFormat.JSON_OBJECT:
@@ -136,8 +141,7 @@ Respond ONLY with JSON. No additional text."""
     def _parse_xml(self, text: str) -> Dict[str, Any]:
         try:
             data = {}
-            pattern = re.compile(r"<(\w+)>(.*?)</\1>")
-            for match in pattern.finditer(text):
+            for match in _XML_TAG_RE.finditer(text):
                 key, value = match.groups()
                 data[key] = value.strip()
             return {"success": True, "data": data}
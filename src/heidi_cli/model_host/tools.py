@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import ast
 import json
 import logging
 import asyncio
+from datetime import datetime
 from typing import Dict, Any, List, Optional, Callable, Awaitable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -39,6 +41,7 @@ class ToolCall:
 class ToolRegistry:
     def __init__(self):
         self.tools: Dict[str, ToolDefinition] = {}
+        self._tool_list: Optional[List[Dict[str, Any]]] = None
         self._register_builtin_tools()
 
     def _register_builtin_tools(self):
@@ -117,12 +120,19 @@ class ToolRegistry:
             name=name, description=description, parameters=parameters, handler=handler
         )
         self.tools[name] = tool
+        self._tool_list = None
         logger.info(f"Registered tool: {name}")
 
     def get_tool(self, name: str) -> Optional[ToolDefinition]:
         return self.tools.get(name)
 
     def list_tools(self) -> List[Dict[str, Any]]:
+        """Return tool schemas, rebuilt only after a tool is registered."""
+        if self._tool_list is None:
+            self._tool_list = self._build_tool_list()
+        return self._tool_list
+
+    def _build_tool_list(self) -> List[Dict[str, Any]]:
         return [
             {
                 "type": "function",
@@ -154,7 +164,8 @@ class ToolRegistry:
             if asyncio.iscoroutinefunction(tool.handler):
                 result = await tool.handler(**tool_call.arguments)
             else:
-                result = tool.handler(**tool_call.arguments)
+                # Keep blocking handlers off the event loop
+                result = await asyncio.to_thread(tool.handler, **tool_call.arguments)
 
             tool_call.result = result
             tool_call.status = ToolCallStatus.COMPLETED
@@ -188,7 +199,6 @@ class ToolRegistry:
             allowed_chars = set("0123456789+-*/.() ")
             if not all(c in allowed_chars for c in expression):
                 return {"error": "Invalid characters in expression"}
-            import ast
 
             tree = ast.parse(expression, mode="eval")
             result = eval(compile(tree, "<string>", "eval"))
@@ -198,7 +208,6 @@ class ToolRegistry:
 
     @staticmethod
     def _get_current_time(timezone: str = "UTC") -> Dict[str, Any]:
-        from datetime import datetime
         import pytz
 
         try:
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import time
 import threading
+import uuid
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Callable
@@ -361,8 +362,6 @@ class MetricsCollector:
                     severity: AlertSeverity = AlertSeverity.WARNING,
                     duration_seconds: int = 300) -> str:
         """Create a new alert."""
-        import uuid
-        
         alert_id = str(uuid.uuid4())
         alert = Alert(
             alert_id=alert_id,
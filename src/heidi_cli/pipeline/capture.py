@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import uuid
 from pathlib import Path
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from ..shared.config import ConfigLoader
+from ..shared.serialization import dumps_bytes
+from ..shared.storage import atomic_write_bytes
+
+# Responses larger than this are written next to run.json instead of inline.
+SIDECAR_THRESHOLD = 64 * 1024
+SIDECAR_KEY = "$sidecar"
+RESPONSE_SIDECAR = "response.json"
 
 class CaptureEngine:
     """Captures raw run data for offline curation."""
@@ -24,11 +31,27 @@ class CaptureEngine:
         run_folder.mkdir(parents=True, exist_ok=True)
         return run_folder
 
+    def write_sidecar(self, run_folder: Path, name: str, data: bytes) -> str:
+        """Write a large payload beside run.json and return its relative name."""
+        atomic_write_bytes(run_folder / name, data)
+        return name
+
+    def _write_run(self, run_id: str, data: Dict[str, Any]) -> None:
+        """Create the run folder and write its sidecar and run.json in one pass."""
+        run_folder = self.create_run_folder(run_id)
+
+        response = dumps_bytes(data["response"])
+        if len(response) > SIDECAR_THRESHOLD:
+            response = dumps_bytes({SIDECAR_KEY: self.write_sidecar(run_folder, RESPONSE_SIDECAR, response)})
+
+        # Splice the already-encoded response in rather than serializing it a second time
+        head = dumps_bytes({k: v for k, v in data.items() if k != "response"})
+        atomic_write_bytes(run_folder / "run.json", head[:-1] + b',"response":' + response + b"}")
+
     async def capture_run(self, task: str, messages: List[Dict[str, str]], response: Dict[str, Any], meta: Optional[Dict[str, Any]] = None):
         """Save raw run data and metadata."""
         run_id = str(uuid.uuid4())
-        run_folder = self.create_run_folder(run_id)
-        
+
         data = {
             "run_id": run_id,
             "timestamp": datetime.now().isoformat(),
@@ -37,10 +60,10 @@ class CaptureEngine:
             "response": response,
             "metadata": meta or {}
         }
-        
-        with open(run_folder / "run.json", "w") as f:
-            json.dump(data, f, indent=2)
-            
+
+        # All filesystem work for a run happens in a single worker-thread hop
+        await asyncio.to_thread(self._write_run, run_id, data)
+
         return run_id
 
 capture_engine = CaptureEngine()
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
 import re
-import json
 from datetime import datetime
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
 from ..shared.config import ConfigLoader
+from ..shared.serialization import dumps_bytes, loads
+from .capture import SIDECAR_KEY
+
+logger = logging.getLogger("heidi.curation")
+
+# Number of run files read concurrently while curating
+READ_BATCH_SIZE = 32
 
 class CurationEngine:
     """Crates training datasets from raw runs with secret redaction."""
@@ -46,43 +56,91 @@ class CurationEngine:
             return [self.redact_json(i) for i in data]
         return data
 
+    @staticmethod
+    def _iter_run_dirs(raw_root: Path, date_filter: Optional[str] = None) -> Iterator[Path]:
+        """Yield run folders under the dated raw folders in a single scandir pass."""
+        with os.scandir(raw_root) as dates:
+            for date_entry in dates:
+                if not date_entry.is_dir():
+                    continue
+                if date_filter and date_entry.name != date_filter:
+                    continue
+                with os.scandir(date_entry.path) as runs:
+                    for run_entry in runs:
+                        if run_entry.is_dir():
+                            yield Path(run_entry.path)
+
+    @staticmethod
+    def load_run(run_dir: Path) -> Optional[Dict[str, Any]]:
+        """Read a captured run, inlining a sidecar response; None if it is missing or unreadable."""
+        try:
+            raw_run = loads((run_dir / "run.json").read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping malformed run {run_dir.name}: {e}")
+            return None
+
+        # Inline responses that were captured to a sidecar file
+        response = raw_run.get("response")
+        if isinstance(response, dict) and SIDECAR_KEY in response:
+            try:
+                raw_run["response"] = loads((run_dir / response[SIDECAR_KEY]).read_bytes())
+            except (OSError, ValueError) as e:
+                # One lost sidecar must not abort curation of every other run
+                logger.warning(f"Skipping run {run_dir.name}: unreadable response sidecar: {e}")
+                return None
+        return raw_run
+
     async def curate_dataset(self, date_filter: Optional[str] = None) -> int:
         """Collect raw runs, redact secrets, and write to curated output."""
         raw_root = self.config.state_dirs["datasets_raw"]
         curated_root = self.config.state_dirs["datasets_curated"]
         
-        curated_data = []
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = curated_root / f"dataset_{stamp}.jsonl"
+        tmp_file = output_file.with_suffix(".jsonl.tmp")
+        out = None
         count = 0
         
-        # Iterate through dated folders
-        for date_dir in raw_root.iterdir():
-            if not date_dir.is_dir():
-                continue
-            if date_filter and date_dir.name != date_filter:
-                continue
-            
-            for run_dir in date_dir.iterdir():
-                if not run_dir.is_dir():
-                    continue
-                run_file = run_dir / "run.json"
-                if not run_file.exists():
-                    continue
-                
-                with open(run_file, "r") as f:
-                    raw_run = json.load(f)
-                    
-                # Redact and add to collection
-                curated_run = self.redact_json(raw_run)
-                curated_data.append(curated_run)
-                count += 1
-
-        if curated_data:
-            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = curated_root / f"dataset_{stamp}.jsonl"
-            with open(output_file, "w") as f:
-                for entry in curated_data:
-                    f.write(json.dumps(entry) + "\n")
-                    
+        run_dirs = list(self._iter_run_dirs(raw_root, date_filter))
+
+        def read_batch(start: int) -> asyncio.Future:
+            return asyncio.gather(
+                *(
+                    asyncio.to_thread(self.load_run, run_dir)
+                    for run_dir in run_dirs[start:start + READ_BATCH_SIZE]
+                )
+            )
+
+        pending = read_batch(0) if run_dirs else None
+        try:
+            # Read runs concurrently in bounded batches, prefetching the next batch
+            # while the current one is redacted and written in scan order
+            for start in range(0, len(run_dirs), READ_BATCH_SIZE):
+                batch = await pending
+                next_start = start + READ_BATCH_SIZE
+                pending = read_batch(next_start) if next_start < len(run_dirs) else None
+                for raw_run in batch:
+                    if raw_run is None:
+                        continue
+                    # Redact and stream each record straight to the output file
+                    if out is None:
+                        out = open(tmp_file, "wb")
+                    out.write(dumps_bytes(self.redact_json(raw_run)) + b"\n")
+                    count += 1
+
+            if out is not None:
+                out.close()
+                os.replace(tmp_file, output_file)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if out is not None:
+                out.close()
+            # Only a completed dataset is published; never leave a partial .tmp behind
+            tmp_file.unlink(missing_ok=True)
+
         return count
 
 curation_engine = CurationEngine()
@@ -122,8 +122,9 @@ class EvalHarness:
                 content = response["choices"][0]["message"]["content"]
                 
                 # Check if expected keywords are present
+                content_lower = content.lower()
                 keywords_found = sum(1 for keyword in task["expected_keywords"] 
-                                    if keyword.lower() in content.lower())
+                                    if keyword.lower() in content_lower)
                 
                 task_passed = keywords_found >= len(task["expected_keywords"]) * 0.5  # 50% keywords threshold
                 
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import shutil
 import hashlib
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from ..shared.config import ConfigLoader
+from ..shared.storage import atomic_write_json
 
 logger = logging.getLogger("heidi.registry")
 
@@ -18,6 +21,8 @@ class ModelRegistry:
         self.config = ConfigLoader.load()
         self.registry_root = self.config.state_dirs["registry"]
         self.registry_file = self.registry_root / "registry.json"
+        # (path, stat key, parsed registry) of the last read
+        self._registry_cache: Optional[Tuple[Path, Tuple[int, int, int], Dict[str, Any]]] = None
         self._init_registry()
 
     def _init_registry(self):
@@ -27,16 +32,31 @@ class ModelRegistry:
                 "active_candidate": None,
                 "versions": {}
             }
-            with open(self.registry_file, "w") as f:
-                json.dump(data, f, indent=2)
+            atomic_write_json(self.registry_file, data)
 
     def load_registry(self) -> Dict[str, Any]:
-        with open(self.registry_file, "r") as f:
-            return json.load(f)
+        st = os.stat(self.registry_file)
+        # Atomic saves replace the inode, so this key changes on every write
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._registry_cache
+        if cached is None or cached[0] != self.registry_file or cached[1] != key:
+            with open(self.registry_file, "r") as f:
+                data = json.load(f)
+            cached = (self.registry_file, key, data)
+            self._registry_cache = cached
+        return self._copy_registry(cached[2])
 
     def save_registry(self, data: Dict[str, Any]):
-        with open(self.registry_file, "w") as f:
-            json.dump(data, f, indent=2)
+        atomic_write_json(self.registry_file, data)
+        self._registry_cache = None
+
+    @staticmethod
+    def _copy_registry(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the registry deep enough that callers can mutate version entries."""
+        return {
+            **data,
+            "versions": {vid: dict(info) for vid, info in data.get("versions", {}).items()},
+        }
 
     async def register_version(self, version_id: str, path: Path, channel: str = "experimental"):
         """Register a new model version in a specific channel."""
@@ -47,36 +67,45 @@ class ModelRegistry:
         target_path = target_root / version_id
         
         # Copy model to registry state if not already there
-        if not target_path.exists():
+        copied = not target_path.exists()
+        if copied:
             target_path.mkdir(parents=True, exist_ok=True)
             logger.info(f"Copying model from {path} to {target_path}")
             
-            # Real model copying with validation
+            # Real model copying with validation; weights can be many GB, so keep
+            # the copy off the event loop
             if path.is_dir():
                 # Copy entire model directory
-                shutil.copytree(path, target_path, dirs_exist_ok=True)
+                await asyncio.to_thread(shutil.copytree, path, target_path, dirs_exist_ok=True)
             else:
                 # Copy single model file
-                shutil.copy2(path, target_path / "model.bin")
-            
+                await asyncio.to_thread(shutil.copy2, path, target_path / "model.bin")
+
+        # Hash and size the copy once; metadata.json and the registry share them
+        checksum, size_bytes = await asyncio.gather(
+            self._calculate_checksum(target_path),
+            self._get_directory_size(target_path),
+        )
+        registered_at = datetime.now().isoformat()
+
+        if copied:
             # Create metadata file with checksum
             metadata = {
                 "version_id": version_id,
                 "source_path": str(path),
-                "checksum": await self._calculate_checksum(target_path),
-                "size_bytes": await self._get_directory_size(target_path),
-                "registered_at": datetime.now().isoformat()
+                "checksum": checksum,
+                "size_bytes": size_bytes,
+                "registered_at": registered_at
             }
             
-            with open(target_path / "metadata.json", "w") as f:
-                json.dump(metadata, f, indent=2)
+            atomic_write_json(target_path / "metadata.json", metadata)
         
         data["versions"][version_id] = {
             "path": str(target_path),
             "channel": channel,
-            "registered_at": datetime.now().isoformat(),
-            "checksum": await self._calculate_checksum(target_path),
-            "size_bytes": await self._get_directory_size(target_path)
+            "registered_at": registered_at,
+            "checksum": checksum,
+            "size_bytes": size_bytes
         }
         
         self.save_registry(data)
@@ -84,28 +113,46 @@ class ModelRegistry:
     
     async def _calculate_checksum(self, path: Path) -> str:
         """Calculate SHA-256 checksum for model directory."""
+        return await asyncio.to_thread(self._checksum_sync, path)
+
+    def _checksum_sync(self, path: Path) -> str:
         hash_sha256 = hashlib.sha256()
         
         if path.is_file():
-            with open(path, "rb") as f:
-                hash_sha256.update(f.read())
+            self._hash_file(hash_sha256, path)
         else:
             for file_path in sorted(path.rglob("*")):
                 if file_path.is_file():
-                    with open(file_path, "rb") as f:
-                        hash_sha256.update(f.read())
+                    self._hash_file(hash_sha256, file_path)
         
         return hash_sha256.hexdigest()
+
+    @staticmethod
+    def _hash_file(digest, path: Path, chunk_size: int = 1 << 20):
+        """Feed a file into a digest in fixed-size chunks; weights can be many GB."""
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
     
     async def _get_directory_size(self, path: Path) -> int:
         """Get total size of directory in bytes."""
+        return await asyncio.to_thread(self._directory_size_sync, path)
+
+    @staticmethod
+    def _directory_size_sync(path: Path) -> int:
         if path.is_file():
             return path.stat().st_size
         
+        # scandir hands back file types with the listing, so each file costs one stat
         total_size = 0
-        for file_path in path.rglob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
+        stack = [path]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
         return total_size
 
     async def promote(self, version_id: str, to_channel: str = "stable"):
@@ -214,11 +261,11 @@ class ModelRegistry:
         model_path = Path(info["path"])
         
         # Load additional metadata if available
-        metadata_file = model_path / "metadata.json"
-        metadata = {}
-        if metadata_file.exists():
-            with open(metadata_file, "r") as f:
+        try:
+            with open(model_path / "metadata.json", "r") as f:
                 metadata = json.load(f)
+        except FileNotFoundError:
+            metadata = {}
         
         return {
             "id": version_id,
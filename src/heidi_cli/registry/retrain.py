@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import uuid
 import asyncio
 from typing import Optional
@@ -26,10 +27,19 @@ class RetrainingEngine:
         if not dataset_path:
             # Find the latest curated dataset
             curated_dir = self.config.state_dirs["datasets_curated"]
-            datasets = sorted(curated_dir.glob("dataset_*.jsonl"))
-            if not datasets:
+            # Dataset names embed a sortable timestamp, so the max name is the latest
+            with os.scandir(curated_dir) as it:
+                latest = max(
+                    (
+                        e.name
+                        for e in it
+                        if e.name.startswith("dataset_") and e.name.endswith(".jsonl")
+                    ),
+                    default=None,
+                )
+            if latest is None:
                 raise FileNotFoundError("No curated datasets found for retraining.")
-            dataset_path = datasets[-1]
+            dataset_path = curated_dir / latest
 
         job_id = f"train-{datetime.now().strftime('%Y%m%d%H%M%S')}-{str(uuid.uuid4())[:8]}"
         logger.info(f"Starting retraining job {job_id} using dataset {dataset_path.name}")
@@ -1,42 +1,42 @@
 from __future__ import annotations
 
-import os
-
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from .shared.config import ConfigLoader
+from .shared.config import CORS_MAX_AGE, ConfigLoader, get_cors_origins
 
 app = FastAPI(title="Heidi Learning Suite API")
 
 # Load suite config
 suite_config = ConfigLoader.load()
 
-# CORS allowlist from config or env
-_cors_env = os.getenv("HEIDI_CORS_ORIGINS", "").strip()
-if _cors_env:
-    ALLOW_ORIGINS = [o.strip() for o in _cors_env.split(",") if o.strip()]
-else:
-    ALLOW_ORIGINS = ["*"] # Default to open for internal suite development
+# CORS allowlist from env, defaulting to local UIs
+ALLOW_ORIGINS = get_cors_origins()
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOW_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=CORS_MAX_AGE,
 )
 
+# Constant body for load balancer and launcher health probes
+_HEALTH_BODY = b'{"status":"healthy","service":"heidi-learning-suite"}'
+_EMPTY_MODELS_BODY = b'{"object":"list","data":[]}'
+
+
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "service": "heidi-learning-suite"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 # Placeholder for OpenAI Compatibility Layer (Module 1)
 # These will be implemented in Phase 1
 @app.get("/v1/models")
 async def list_models():
     # To be implemented in Phase 1
-    return {"object": "list", "data": []}
+    return Response(content=_EMPTY_MODELS_BODY, media_type="application/json")
 
 @app.post("/v1/chat/completions")
 async def chat_completions():
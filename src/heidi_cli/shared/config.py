@@ -2,19 +2,62 @@ from __future__ import annotations
 
 import os
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, FrozenSet, List
 from pydantic import BaseModel, Field, model_validator
 
 
 def find_project_root() -> Path:
     """Find the project root by walking up for pyproject.toml."""
-    current = Path.cwd().resolve()
+    return _find_project_root(os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _find_project_root(cwd: str) -> Path:
+    start = Path(cwd).resolve()
+    current = start
     while current != current.parent:
         if (current / "pyproject.toml").exists():
             return current
         current = current.parent
-    return Path.cwd().resolve()
+    return start
+
+
+# Local UIs allowed by default; override with HEIDI_CORS_ORIGINS
+DEFAULT_CORS_ORIGINS = [
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+]
+
+
+# Browsers may cache preflight results this long (Chromium caps at 2 hours)
+CORS_MAX_AGE = 7200
+
+
+def get_cors_origins() -> FrozenSet[str]:
+    """Get the CORS allowlist from HEIDI_CORS_ORIGINS or the local UI defaults.
+
+    A frozenset keeps the per-request origin check in CORSMiddleware a hash lookup.
+    """
+    env = os.getenv("HEIDI_CORS_ORIGINS", "").strip()
+    if env:
+        return frozenset(o.strip() for o in env.split(",") if o.strip())
+    return frozenset(DEFAULT_CORS_ORIGINS)
+
+
+def get_worker_threads() -> Optional[int]:
+    """Get the blocking-call thread pool size from HEIDI_WORKER_THREADS, if set.
+
+    This sizes threads inside one model host process; the number of model host
+    processes is SuiteConfig.workers (HEIDI_SUITE_WORKERS).
+    """
+    env = os.getenv("HEIDI_WORKER_THREADS", "").strip()
+    if env.isdigit() and int(env) > 0:
+        return int(env)
+    return None
 
 
 def get_default_state_root() -> Path:
@@ -25,6 +68,24 @@ def get_default_state_root() -> Path:
     return find_project_root() / "state"
 
 
+@lru_cache(maxsize=8)
+def _state_dirs(root: Path) -> Dict[str, Path]:
+    """Build the state directory layout once per data root."""
+    return {
+        "config": root / "config",
+        "memory": root / "memory",
+        "events": root / "events",
+        "datasets_raw": root / "datasets" / "raw",
+        "datasets_curated": root / "datasets" / "curated",
+        "models_stable": root / "models" / "stable" / "versions",
+        "models_candidate": root / "models" / "candidate" / "versions",
+        "models_experimental": root / "models" / "experimental" / "versions",
+        "registry": root / "registry",
+        "logs": root / "logs",
+        "evals": root / "evals",
+    }
+
+
 class ModelConfig(BaseModel):
     id: str
     path: Path
@@ -54,6 +115,10 @@ class SuiteConfig(BaseModel):
     request_timeout: int = 60
     max_memory_gb: int = 32
     max_concurrent_requests: int = 10
+    max_concurrent_generations: int = 1
+    # Model host processes (HEIDI_SUITE_WORKERS); each loads its own copy of the
+    # model, and a hot-swap reload only reaches the process that receives it
+    workers: int = 1
 
     memory_enabled: bool = True
     memory_sqlite_path: Optional[Path] = None
@@ -80,20 +145,7 @@ class SuiteConfig(BaseModel):
 
     @property
     def state_dirs(self) -> Dict[str, Path]:
-        root = self.data_root
-        return {
-            "config": root / "config",
-            "memory": root / "memory",
-            "events": root / "events",
-            "datasets_raw": root / "datasets" / "raw",
-            "datasets_curated": root / "datasets" / "curated",
-            "models_stable": root / "models" / "stable" / "versions",
-            "models_candidate": root / "models" / "candidate" / "versions",
-            "models_experimental": root / "models" / "experimental" / "versions",
-            "registry": root / "registry",
-            "logs": root / "logs",
-            "evals": root / "evals",
-        }
+        return dict(_state_dirs(self.data_root))
 
     def ensure_dirs(self):
         for path in self.state_dirs.values():
@@ -123,6 +175,13 @@ class SuiteConfig(BaseModel):
         return d
 
 
+@lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> Dict:
+    """Parse suite.json once per (mtime, size); edits to the file change the key."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
 class ConfigLoader:
     @staticmethod
     def load() -> SuiteConfig:
@@ -133,15 +192,14 @@ class ConfigLoader:
         if env_config:
             config_path = Path(env_config)
 
-        if config_path.exists():
-            try:
-                with open(config_path, "r") as f:
-                    data = json.load(f)
-                    config = SuiteConfig(**data)
-            except Exception as e:
-                print(f"Warning: Failed to load suite config from {config_path}: {e}")
-                config = SuiteConfig()
-        else:
+        try:
+            st = os.stat(config_path)
+            data = _read_config_file(str(config_path), st.st_mtime_ns, st.st_size)
+            config = SuiteConfig(**data)
+        except FileNotFoundError:
+            config = SuiteConfig()
+        except Exception as e:
+            print(f"Warning: Failed to load suite config from {config_path}: {e}")
             config = SuiteConfig()
 
         # Env overrides
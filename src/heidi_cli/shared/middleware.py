@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+
+# Only compress bodies worth the CPU; small JSON replies go out as-is
+GZIP_MINIMUM_SIZE = 1024
+GZIP_COMPRESSLEVEL = 5
+
+
+def add_gzip_middleware(app: FastAPI) -> bool:
+    """Enable gzip on app when Starlette leaves event streams uncompressed.
+
+    Starlette releases before 0.46 gzip streamed bodies too, which buffers SSE
+    completions inside the compressor, so compression stays off there.
+    """
+    try:
+        from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES, GZipMiddleware
+    except ImportError:
+        return False
+    if "text/event-stream" not in DEFAULT_EXCLUDED_CONTENT_TYPES:
+        return False
+    app.add_middleware(
+        GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESSLEVEL
+    )
+    return True
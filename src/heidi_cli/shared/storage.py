@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+import os
+import stat
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+
+@lru_cache(maxsize=1)
+def _new_file_mode() -> int:
+    """Mode a plain open() would give a new file under the process umask."""
+    # os.umask can only be read by setting it; do that once and restore it
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a unique sibling temp file and atomically replace the destination."""
+    # A per-call temp name keeps concurrent writers of the same file from clobbering each other
+    tmp = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        # mkstemp creates 0600; keep the target's mode (or the umask default) instead
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = _new_file_mode()
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_json(path: Path, data: Any, indent: int = 2) -> None:
+    """Serialize data as JSON and write it atomically."""
+    atomic_write_bytes(path, json.dumps(data, indent=indent).encode("utf-8"))
@@ -49,7 +49,7 @@ def token_history(
     )
     
     if json_output:
-        console.print(json.dumps([usage.__dict__ for usage in history], indent=2))
+        console.print(json.dumps([usage.to_dict() for usage in history], indent=2))
         return
     
     if not history:
@@ -275,50 +275,24 @@ def token_stats(
     
     db = get_token_database()
     
-    # Get data for the period
+    # Aggregate per model in SQL rather than loading and decoding every row
     start_date = datetime.now(timezone.utc) - timedelta(days=days)
-    history = db.get_usage_history(
-        limit=10000,  # Large limit for analytics
-        start_date=start_date
-    )
+    model_stats = db.get_usage_by_model(start_date, model_id=model, user_id=user)
     
-    if not history:
+    if not model_stats:
         console.print("[yellow]No usage data found for the specified period.[/yellow]")
         return
     
-    # Apply filters
-    if model:
-        history = [h for h in history if h.model_id == model]
-    if user:
-        history = [h for h in history if h.user_id == user]
-    
-    if not history:
-        console.print("[yellow]No usage data found after applying filters.[/yellow]")
-        return
-    
     # Calculate statistics
-    total_requests = len(history)
-    total_tokens = sum(h.total_tokens for h in history)
-    total_cost = sum(h.cost_usd for h in history)
+    total_requests = sum(s["requests"] for s in model_stats.values())
+    total_tokens = sum(s["tokens"] for s in model_stats.values())
+    total_cost = sum(s["cost"] for s in model_stats.values())
     
     # Daily averages
     avg_daily_requests = total_requests / days
     avg_daily_tokens = total_tokens / days
     avg_daily_cost = total_cost / days
     
-    # Model breakdown
-    model_stats = {}
-    for usage in history:
-        if usage.model_id not in model_stats:
-            model_stats[usage.model_id] = {
-                "requests": 0,
-                "tokens": 0,
-                "cost": 0.0
-            }
-        model_stats[usage.model_id]["requests"] += 1
-        model_stats[usage.model_id]["tokens"] += usage.total_tokens
-        model_stats[usage.model_id]["cost"] += usage.cost_usd
-    
     # Find most used model
     most_used_model = max(model_stats.items(), key=lambda x: x[1]["tokens"])
     
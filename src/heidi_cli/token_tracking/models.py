@@ -5,15 +5,21 @@ Token tracking database models and persistence layer.
 from __future__ import annotations
 
 import sqlite3
-import json
+import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, fields
 import logging
 
+from ..shared.serialization import dumps, dumps_indented, loads
+
 logger = logging.getLogger("heidi.tokens")
 
+# Cost configs are looked up per request but edited from the CLI in another
+# process; re-read them from the database at most this often
+COST_CONFIG_TTL = 60.0
+
 
 @dataclass
 class TokenUsage:
@@ -51,6 +57,16 @@ class TokenUsage:
             return self.timestamp.isoformat()
         return ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field dict with an ISO timestamp, ready for JSON export."""
+        data = {name: getattr(self, name) for name in _USAGE_FIELDS}
+        data['timestamp'] = self.timestamp_iso
+        return data
+
+
+# Field names in declaration order; asdict() would deep-copy metadata per row
+_USAGE_FIELDS = tuple(f.name for f in fields(TokenUsage))
+
 
 @dataclass
 class CostConfig:
@@ -77,6 +93,8 @@ class TokenDatabase:
         
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # (provider, model_id) -> (loaded_at, config or None) for get_cost_config
+        self._cost_configs: Dict[Tuple[str, str], Tuple[float, Optional[CostConfig]]] = {}
         self._init_database()
     
     def _init_database(self):
@@ -147,7 +165,7 @@ class TokenDatabase:
                 usage.request_type,
                 usage.model_provider,
                 usage.cost_usd,
-                json.dumps(usage.metadata) if usage.metadata else None
+                dumps(usage.metadata) if usage.metadata else None
             ))
             
             conn.commit()
@@ -195,7 +213,7 @@ class TokenDatabase:
             
             results = []
             for row in cursor.fetchall():
-                metadata = json.loads(row['metadata']) if row['metadata'] else {}
+                metadata = loads(row['metadata']) if row['metadata'] else {}
                 results.append(TokenUsage(
                     id=row['id'],
                     timestamp=datetime.fromisoformat(row['timestamp']),
@@ -213,6 +231,45 @@ class TokenDatabase:
             
             return results
     
+    def get_usage_by_model(
+        self,
+        start_date: datetime,
+        model_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Aggregate requests, tokens and cost per model since start_date."""
+        query = """
+            SELECT 
+                model_id,
+                COUNT(*) as requests,
+                SUM(total_tokens) as tokens,
+                SUM(cost_usd) as cost
+            FROM token_usage 
+            WHERE timestamp >= ?
+        """
+        params = [start_date.isoformat()]
+        
+        if model_id:
+            query += " AND model_id = ?"
+            params.append(model_id)
+        
+        if user_id:
+            query += " AND user_id = ?"
+            params.append(user_id)
+        
+        query += " GROUP BY model_id"
+        
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            return {
+                row['model_id']: {
+                    "requests": row['requests'],
+                    "tokens": row['tokens'] or 0,
+                    "cost": row['cost'] or 0.0
+                }
+                for row in conn.execute(query, params)
+            }
+    
     def get_usage_summary(
         self,
         period: str = "day",  # day, week, month, year
@@ -319,9 +376,21 @@ class TokenDatabase:
                 now
             ))
             conn.commit()
+        self._cost_configs.pop((config.provider, config.model_id), None)
     
     def get_cost_config(self, provider: str, model_id: str) -> Optional[CostConfig]:
         """Get cost configuration for a model."""
+        key = (provider, model_id)
+        now = time.monotonic()
+        cached = self._cost_configs.get(key)
+        if cached is not None and now - cached[0] < COST_CONFIG_TTL:
+            return cached[1]
+
+        config = self._load_cost_config(provider, model_id)
+        self._cost_configs[key] = (now, config)
+        return config
+
+    def _load_cost_config(self, provider: str, model_id: str) -> Optional[CostConfig]:
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("""
@@ -354,23 +423,17 @@ class TokenDatabase:
         )
         
         if format == "json":
-            # Convert TokenUsage objects to dictionaries with ISO timestamps
-            export_data = []
-            for usage in usage_history:
-                usage_dict = asdict(usage)
-                usage_dict['timestamp'] = usage.timestamp_iso
-                export_data.append(usage_dict)
-            return json.dumps(export_data, indent=2)
+            return dumps_indented([usage.to_dict() for usage in usage_history])
         elif format == "csv":
             import csv
             import io
             
             output = io.StringIO()
             if usage_history:
-                writer = csv.DictWriter(output, fieldnames=asdict(usage_history[0]).keys())
+                writer = csv.DictWriter(output, fieldnames=_USAGE_FIELDS)
                 writer.writeheader()
                 for usage in usage_history:
-                    writer.writerow(asdict(usage))
+                    writer.writerow({name: getattr(usage, name) for name in _USAGE_FIELDS})
             
             return output.getvalue()
         else:
@@ -0,0 +1,18 @@
+import json
+import os
+
+
+def test_config_loader_picks_up_edits(tmp_path, monkeypatch):
+    from heidi_cli.shared.config import ConfigLoader
+
+    config_file = tmp_path / "suite.json"
+    config_file.write_text(json.dumps({"port": 8001}))
+    monkeypatch.setenv("HEIDI_SUITE_CONFIG", str(config_file))
+
+    assert ConfigLoader.load().port == 8001
+    assert ConfigLoader.load().port == 8001
+
+    config_file.write_text(json.dumps({"port": 18002}))
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert ConfigLoader.load().port == 18002
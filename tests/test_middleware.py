@@ -0,0 +1,24 @@
+def test_gzip_skips_event_streams():
+    from fastapi import FastAPI
+    from fastapi.responses import PlainTextResponse, StreamingResponse
+    from fastapi.testclient import TestClient
+
+    from heidi_cli.shared.middleware import add_gzip_middleware
+
+    app = FastAPI()
+    add_gzip_middleware(app)
+
+    @app.get("/big")
+    def big():
+        return PlainTextResponse("x" * 4096)
+
+    @app.get("/stream")
+    def stream():
+        chunks = (b"data: " + b"x" * 2048 + b"\n\n" for _ in range(3))
+        return StreamingResponse(chunks, media_type="text/event-stream")
+
+    client = TestClient(app)
+    headers = {"Accept-Encoding": "gzip"}
+
+    assert client.get("/big", headers=headers).headers.get("content-encoding") == "gzip"
+    assert "content-encoding" not in client.get("/stream", headers=headers).headers
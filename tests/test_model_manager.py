@@ -85,6 +85,7 @@ class TestModelManager:
         mock_config.top_k = 40
         mock_config.max_memory_gb = 4
         mock_config.max_concurrent_requests = 5
+        mock_config.max_concurrent_generations = 1
         mock_config.allowed_model_paths = [temp_dir]
         return mock_config
     
@@ -196,6 +197,35 @@ class TestModelManager:
         count = manager._estimate_token_count(long_text)
         assert count > 1
     
+    def test_list_models_cached_within_ttl(self, mock_config):
+        """Test that list_models reuses the built list until the TTL expires."""
+        manager = ModelManager()
+
+        with patch.object(manager, '_build_model_list', return_value=[{"id": "m"}]) as build:
+            first = manager.list_models()
+            second = manager.list_models()
+            assert first == second == [{"id": "m"}]
+            assert first is not second
+            assert build.call_count == 1
+
+            manager._models_cache = (manager._models_cache[0] - 60, first)
+            manager.list_models()
+            assert build.call_count == 2
+
+    @patch('heidi_cli.model_host.manager.ConfigLoader')
+    def test_list_models_rebuilt_after_unload(self, mock_config_loader, mock_config):
+        """Test that unloading drops the cached model list."""
+        mock_config_loader.load.return_value = mock_config
+        manager = ModelManager()
+        manager.model = Mock()
+
+        with patch.object(manager, '_build_model_list', return_value=[{"id": "m"}]) as build:
+            manager.list_models()
+            with patch('gc.collect'):
+                manager.unload_model()
+            manager.list_models()
+            assert build.call_count == 2
+
     def test_fallback_response(self, mock_config):
         """Test fallback response generation."""
         manager = ModelManager()
@@ -360,6 +390,53 @@ class TestModelManager:
             assert response["choices"][0]["message"]["content"] == "Test response"
             assert response["usage"]["total_tokens"] > 0
 
+    @patch('heidi_cli.model_host.manager.ConfigLoader')
+    def test_unload_waits_for_inflight_generation(self, mock_config_loader, mock_config):
+        """Unloading mid-generation must not pull the model out from under the request."""
+        import time
+
+        mock_config_loader.load.return_value = mock_config
+        manager = ModelManager()
+
+        class Tokens(list):
+            shape = (1, 3)
+
+            def to(self, device):
+                return self
+
+        class SlowModel:
+            def parameters(self):
+                return iter([Mock()])
+
+            def generate(self, inputs, **kwargs):
+                time.sleep(0.3)
+                return Tokens([[1, 2, 3, 4, 5]])
+
+            def cpu(self):
+                pass
+
+        tokenizer = Mock()
+        tokenizer.apply_chat_template.return_value = Tokens([1, 2, 3])
+        tokenizer.decode.return_value = "generated"
+        manager.model = SlowModel()
+        manager.tokenizer = tokenizer
+
+        async def run():
+            request = asyncio.create_task(
+                manager._get_local_response("test-model", [{"role": "user", "content": "hi"}])
+            )
+            await asyncio.sleep(0.1)
+            await manager.unload_model_when_idle()
+            assert request.done()
+            return await request
+
+        with patch.object(manager, '_check_memory_usage', return_value=True), \
+                patch.object(manager, '_record_token_usage'):
+            response = asyncio.run(run())
+
+        assert response["choices"][0]["message"]["content"] == "generated"
+        assert manager.model is None
+
 
 class TestThreadSafety:
     """Test thread safety of ModelManager."""
@@ -0,0 +1,60 @@
+import asyncio
+
+
+def test_coalesce_shares_one_call_between_concurrent_callers():
+    from heidi_cli.model_host.performance import PerformanceOptimizer
+
+    perf = PerformanceOptimizer()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"answer": 42}
+
+    async def run():
+        results = await asyncio.gather(*(perf.coalesce("k", factory) for _ in range(5)))
+        assert all(r == {"answer": 42} for r in results)
+        assert calls == 1
+        assert not perf._inflight
+
+        await perf.coalesce("k", factory)
+        assert calls == 2
+
+    asyncio.run(run())
+
+
+def test_reasoning_endpoint_only_reuses_greedy_completions(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from heidi_cli.model_host import server
+    from heidi_cli.model_host.performance import get_performance_optimizer
+
+    calls = 0
+
+    async def fake_get_response(**kwargs):
+        nonlocal calls
+        calls += 1
+        return {"choices": [{"message": {"role": "assistant", "content": f"reply {calls}"}}]}
+
+    monkeypatch.setattr(server.manager, "get_response", fake_get_response)
+    get_performance_optimizer().response_cache.clear()
+    client = TestClient(server.app)
+
+    def post(temperature):
+        body = {
+            "model": "local-test",
+            "messages": [{"role": "user", "content": "same prompt"}],
+            "temperature": temperature,
+        }
+        return client.post("/v1/chat/completions/with-reasoning", json=body).json()
+
+    sampled = [post(0.7), post(0.7)]
+    assert calls == 2
+    assert sampled[0]["choices"] != sampled[1]["choices"]
+
+    greedy = [post(0), post(0)]
+    assert calls == 3
+    assert greedy[0]["choices"] == greedy[1]["choices"]
+    assert greedy[0]["id"] != greedy[1]["id"]
@@ -68,6 +68,89 @@ async def _test_pipeline_capture_and_curate():
     assert "[REDACTED]" == curated_data["response"]["nested"]["password"]
     assert curated_data["response"]["nested"]["normal"] == "value"
     
+def test_large_response_uses_sidecar():
+    asyncio.run(_test_large_response_uses_sidecar())
+
+async def _test_large_response_uses_sidecar():
+    from heidi_cli.pipeline.capture import capture_engine, SIDECAR_THRESHOLD
+    from heidi_cli.pipeline.curation import curation_engine
+
+    response = {"content": "x" * (SIDECAR_THRESHOLD + 1)}
+    await capture_engine.capture_run("big_task", [], response)
+
+    run_file = next(MockConfig.state_dirs["datasets_raw"].glob("*/*/run.json"))
+    assert run_file.stat().st_size < SIDECAR_THRESHOLD
+    assert (run_file.parent / "response.json").exists()
+
+    assert await curation_engine.curate_dataset() == 1
+    curated_file = next(MockConfig.state_dirs["datasets_curated"].glob("*.jsonl"))
+    with open(curated_file, "r") as f:
+        curated_data = json.loads(f.readline())
+    assert curated_data["response"] == response
+
+def test_missing_sidecar_skips_only_that_run():
+    asyncio.run(_test_missing_sidecar_skips_only_that_run())
+
+async def _test_missing_sidecar_skips_only_that_run():
+    from heidi_cli.pipeline.capture import capture_engine, SIDECAR_THRESHOLD, RESPONSE_SIDECAR
+    from heidi_cli.pipeline.curation import curation_engine
+
+    await capture_engine.capture_run("big_task", [], {"content": "x" * (SIDECAR_THRESHOLD + 1)})
+    kept_ids = {
+        await capture_engine.capture_run("small_task", [], {"status": "ok"}) for _ in range(2)
+    }
+    next(MockConfig.state_dirs["datasets_raw"].glob(f"*/*/{RESPONSE_SIDECAR}")).unlink()
+
+    assert await curation_engine.curate_dataset() == 2
+    curated_file = next(MockConfig.state_dirs["datasets_curated"].glob("*.jsonl"))
+    with open(curated_file, "r") as f:
+        assert {json.loads(line)["run_id"] for line in f} == kept_ids
+
+def test_failed_curation_leaves_no_temp_file(monkeypatch):
+    asyncio.run(_test_failed_curation_leaves_no_temp_file(monkeypatch))
+
+async def _test_failed_curation_leaves_no_temp_file(monkeypatch):
+    from heidi_cli.pipeline.capture import capture_engine
+    from heidi_cli.pipeline.curation import curation_engine
+
+    await capture_engine.capture_run("task", [], {"status": "ok"})
+
+    def fail_redaction(data):
+        raise RuntimeError("redaction failed")
+
+    monkeypatch.setattr(curation_engine, "redact_json", fail_redaction)
+    with pytest.raises(RuntimeError):
+        await curation_engine.curate_dataset()
+
+    assert list(MockConfig.state_dirs["datasets_curated"].iterdir()) == []
+
+def test_failed_prefetched_batch_leaves_no_temp_file(monkeypatch):
+    asyncio.run(_test_failed_prefetched_batch_leaves_no_temp_file(monkeypatch))
+
+async def _test_failed_prefetched_batch_leaves_no_temp_file(monkeypatch):
+    from heidi_cli.pipeline import curation
+    from heidi_cli.pipeline.capture import capture_engine
+
+    for _ in range(3):
+        await capture_engine.capture_run("task", [], {"status": "ok"})
+
+    load_run = curation.CurationEngine.load_run
+    loaded = []
+
+    def flaky_load_run(run_dir):
+        loaded.append(run_dir)
+        if len(loaded) == 2:
+            raise OSError("disk error")
+        return load_run(run_dir)
+
+    # One run per batch, so the failure lands in the prefetched second batch
+    monkeypatch.setattr(curation, "READ_BATCH_SIZE", 1)
+    monkeypatch.setattr(curation.curation_engine, "load_run", flaky_load_run)
+    with pytest.raises(OSError):
+        await curation.curation_engine.curate_dataset()
+
+    assert list(MockConfig.state_dirs["datasets_curated"].iterdir()) == []
+
 def test_text_redaction():
     from heidi_cli.pipeline.curation import CurationEngine
     engine = CurationEngine()
@@ -97,3 +97,24 @@ async def _test_hotswap_manager(monkeypatch):
     
     success2 = await hotswap_manager.reload_stable_model()
     assert success2 is False
+
+def test_load_registry_returns_independent_copies():
+    from heidi_cli.registry.manager import model_registry
+
+    reg = model_registry.load_registry()
+    reg["active_stable"] = "mutated"
+    assert model_registry.load_registry()["active_stable"] is None
+
+    reg["versions"]["v1"] = {"channel": "stable"}
+    model_registry.save_registry(reg)
+    assert model_registry.load_registry()["versions"]["v1"]["channel"] == "stable"
+
+def test_directory_size_does_not_follow_directory_symlinks(tmp_path):
+    from heidi_cli.registry.manager import ModelRegistry
+
+    model_dir = tmp_path / "model"
+    (model_dir / "sub").mkdir(parents=True)
+    (model_dir / "sub" / "weights.bin").write_bytes(b"x" * 10)
+    (model_dir / "loop").symlink_to(model_dir, target_is_directory=True)
+
+    assert ModelRegistry._directory_size_sync(model_dir) == 10
@@ -0,0 +1,78 @@
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+
+def test_atomic_write_json_replaces_file(tmp_path: Path):
+    from heidi_cli.shared.storage import atomic_write_json
+
+    target = tmp_path / "registry.json"
+    target.write_text("{\"stale\": true}")
+
+    atomic_write_json(target, {"active_stable": "v-1"})
+
+    assert json.loads(target.read_text()) == {"active_stable": "v-1"}
+    assert [p.name for p in tmp_path.iterdir()] == ["registry.json"]
+
+
+def test_atomic_write_bytes_cleans_up_on_failure(tmp_path: Path, monkeypatch):
+    from heidi_cli.shared import storage
+
+    target = tmp_path / "pids.json"
+
+    def fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(storage.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        storage.atomic_write_bytes(target, b"{}")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_atomic_write_bytes_uses_umask_mode_for_new_files(tmp_path: Path):
+    from heidi_cli.shared import storage
+
+    umask = os.umask(0o022)
+    storage._new_file_mode.cache_clear()
+    try:
+        target = tmp_path / "run.json"
+        storage.atomic_write_bytes(target, b"{}")
+    finally:
+        os.umask(umask)
+        storage._new_file_mode.cache_clear()
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+
+def test_atomic_write_bytes_keeps_existing_mode(tmp_path: Path):
+    from heidi_cli.shared.storage import atomic_write_bytes
+
+    target = tmp_path / "registry.json"
+    target.write_bytes(b"{}")
+    target.chmod(0o640)
+
+    atomic_write_bytes(target, b'{"active_stable": null}')
+
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert target.read_bytes() == b'{"active_stable": null}'
+
+
+def test_atomic_write_bytes_leaves_no_temp_file_when_write_fails(tmp_path: Path, monkeypatch):
+    from heidi_cli.shared import storage
+
+    target = tmp_path / "pids.json"
+    target.write_bytes(b"{}")
+
+    def fail_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(storage.os, "fsync", fail_fsync)
+    with pytest.raises(OSError):
+        storage.atomic_write_bytes(target, b'{"model_host": 1}')
+
+    assert [p.name for p in tmp_path.iterdir()] == ["pids.json"]
+    assert target.read_bytes() == b"{}"
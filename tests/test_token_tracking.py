@@ -218,7 +218,33 @@ class TestTokenDatabase:
         assert summary["total"]["cost_usd"] == 0.09
         assert "model-1" in summary["by_model"]
         assert "model-2" in summary["by_model"]
-    
+
+    def test_get_usage_by_model(self, temp_db):
+        """Test per-model aggregation done in SQL."""
+        for tokens in (100, 200):
+            temp_db.record_usage(TokenUsage(
+                model_id="model-1",
+                session_id="session-1",
+                user_id="user-1",
+                total_tokens=tokens,
+                cost_usd=0.01
+            ))
+        temp_db.record_usage(TokenUsage(
+            model_id="model-2",
+            session_id="session-2",
+            user_id="user-2",
+            total_tokens=50,
+            cost_usd=0.02
+        ))
+
+        start = datetime.now(timezone.utc) - timedelta(days=1)
+        stats = temp_db.get_usage_by_model(start)
+
+        assert stats["model-1"]["requests"] == 2
+        assert stats["model-1"]["tokens"] == 300
+        assert stats["model-2"]["tokens"] == 50
+        assert list(temp_db.get_usage_by_model(start, user_id="user-2")) == ["model-2"]
+
     def test_cost_config_management(self, temp_db):
         """Test cost configuration management."""
         config = CostConfig(
@@ -242,7 +268,23 @@ class TestTokenDatabase:
         # Test non-existent config
         non_existent = temp_db.get_cost_config("nonexistent", "model")
         assert non_existent is None
-    
+
+    def test_cost_config_cached_until_saved(self, temp_db):
+        """Test cost config lookups are cached and invalidated on save."""
+        assert temp_db.get_cost_config("local", "model-1") is None
+
+        with patch.object(temp_db, "_load_cost_config") as load:
+            assert temp_db.get_cost_config("local", "model-1") is None
+            load.assert_not_called()
+
+        temp_db.save_cost_config(CostConfig(
+            provider="local",
+            model_id="model-1",
+            input_cost_per_1k=0.01,
+            output_cost_per_1k=0.02
+        ))
+        assert temp_db.get_cost_config("local", "model-1").output_cost_per_1k == 0.02
+
     def test_export_usage(self, temp_db):
         """Test usage data export."""
         # Create test data
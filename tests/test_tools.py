@@ -0,0 +1,11 @@
+def test_list_tools_cache_invalidated_on_register():
+    from heidi_cli.model_host.tools import ToolRegistry
+
+    registry = ToolRegistry()
+    first = registry.list_tools()
+    assert registry.list_tools() is first
+
+    registry.register_tool(name="noop", description="Do nothing", parameters={"type": "object"})
+    names = [t["function"]["name"] for t in registry.list_tools()]
+    assert "noop" in names
+    assert registry.list_tools() is not first
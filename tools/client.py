@@ -71,6 +71,15 @@ class Pipe:
         self._agents_cache_time = 0
         self._models_cache = None
         self._models_cache_time = 0
+        self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared client so requests to the Heidi server reuse pooled connections."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return self._client
 
     @property
     def server_url(self) -> str:
@@ -95,8 +104,8 @@ class Pipe:
 
         try:
             url = f"{self.server_url}/models"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self._get_headers(), timeout=10)
+            client = self._get_client()
+            response = await client.get(url, headers=self._get_headers(), timeout=10)
             if response.status_code == 200:
                 models_data = response.json()
                 if isinstance(models_data, list):
@@ -139,8 +148,8 @@ class Pipe:
 
         try:
             url = f"{self.server_url}/agents"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self._get_headers(), timeout=10)
+            client = self._get_client()
+            response = await client.get(url, headers=self._get_headers(), timeout=10)
             if response.status_code == 200:
                 agents_data = response.json()
                 self._agents_cache = [
@@ -218,8 +227,8 @@ class Pipe:
         # Add Ollama models if enabled
         if self.valves.ENABLE_OLLAMA:
             try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(f"{self.valves.OLLAMA_URL}/api/tags", timeout=10)
+                client = self._get_client()
+                resp = await client.get(f"{self.valves.OLLAMA_URL}/api/tags", timeout=10)
                 if resp.status_code == 200:
                     data = resp.json()
                     for model in data.get("models", []):
@@ -325,13 +334,13 @@ class Pipe:
         payload = {k: v for k, v in payload.items() if v}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=self._get_headers(),
-                    timeout=self.valves.REQUEST_TIMEOUT,
-                )
+            client = self._get_client()
+            response = await client.post(
+                url,
+                json=payload,
+                headers=self._get_headers(),
+                timeout=self.valves.REQUEST_TIMEOUT,
+            )
             response.raise_for_status()
             data = response.json()
 
@@ -379,13 +388,13 @@ class Pipe:
         payload = {k: v for k, v in payload.items() if v}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=self._get_headers(),
-                    timeout=self.valves.REQUEST_TIMEOUT,
-                )
+            client = self._get_client()
+            response = await client.post(
+                url,
+                json=payload,
+                headers=self._get_headers(),
+                timeout=self.valves.REQUEST_TIMEOUT,
+            )
             response.raise_for_status()
             data = response.json()
 
@@ -425,8 +434,8 @@ class Pipe:
         """List recent runs."""
         url = f"{self.server_url}/runs"
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self._get_headers(), timeout=10)
+            client = self._get_client()
+            response = await client.get(url, headers=self._get_headers(), timeout=10)
             response.raise_for_status()
             runs = response.json()
 
@@ -498,13 +507,13 @@ class Pipe:
         payload = {k: v for k, v in payload.items() if v}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=self._get_headers(),
-                    timeout=self.valves.REQUEST_TIMEOUT,
-                )
+            client = self._get_client()
+            response = await client.post(
+                url,
+                json=payload,
+                headers=self._get_headers(),
+                timeout=self.valves.REQUEST_TIMEOUT,
+            )
             response.raise_for_status()
             data = response.json()
 